@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Conversion Cache
+Remembers which PDF was produced for a presentation's content, so identical
+files (copies, moved or re-synced folders) get a copy of it instead of
+being converted again
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+CACHE_DB = Path.home() / '.cache' / 'pptx2pdf' / 'cache.db'
+
+# Bytes hashed from each end of a .pptx file
+SAMPLE_SIZE = 1024 * 1024
+
+
+def fingerprint(input_file, quality: str, engine: str, size: int = None) -> str:
+    """
+    Fast content fingerprint of a presentation plus the settings that shape its PDF
+
+    A .pptx file is a zip whose central directory, holding the CRC of every
+    part, sits at the end, so hashing the size and the first and last MiB
+    catches any change to its slides. Legacy .ppt files have no such index
+    and are hashed in full.
+
+    Args:
+        input_file: Path to PPTX file
+        quality: Quality preset name
+        engine: Conversion engine name (PowerPoint and LibreOffice PDFs differ)
+        size: File size, if the caller already has it
+    """
+    if size is None:
+        size = os.stat(input_file).st_size
+    digest = hashlib.sha256(f"{size}:{quality}:{engine}:".encode())
+    with open(input_file, 'rb') as f:
+        if size > 2 * SAMPLE_SIZE and os.path.splitext(os.fspath(input_file))[1].lower() == '.pptx':
+            digest.update(f.read(SAMPLE_SIZE))
+            f.seek(-SAMPLE_SIZE, os.SEEK_END)
+            digest.update(f.read(SAMPLE_SIZE))
+        else:
+            for block in iter(lambda: f.read(SAMPLE_SIZE), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def place_pdf(cached_pdf: str, pdf_path: str):
+    """
+    Copy a cached PDF to pdf_path
+
+    A copy rather than a hard link: PowerPoint, Pillow and PDF editors may
+    rewrite a PDF in place, which would silently change every linked copy.
+    """
+    if os.path.exists(pdf_path) and os.path.samefile(cached_pdf, pdf_path):
+        return
+    temp_path = pdf_path + '.tmp'
+    try:
+        os.remove(temp_path)
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(cached_pdf, temp_path)
+    os.replace(temp_path, pdf_path)
+
+
+class ConversionCache:
+    """
+    SQLite index from content fingerprint to the PDF produced for it
+
+    Only the PDF's location is stored; an entry is used only while that PDF
+    still exists with the modification time it had when it was recorded.
+    """
+
+    def __init__(self, db_path=CACHE_DB):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: Location of the SQLite database
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(os.fspath(db_path), timeout=10)
+        try:
+            # WAL lets a second window or CLI run read while this one writes
+            self.db.execute('PRAGMA journal_mode=WAL')
+            self.db.execute(
+                'CREATE TABLE IF NOT EXISTS conversions '
+                '(fingerprint TEXT PRIMARY KEY, pdf_path TEXT NOT NULL, ts REAL NOT NULL)'
+            )
+        except sqlite3.Error:
+            self.db.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database"""
+        self.db.close()
+
+    def lookup(self, key: str):
+        """
+        Find the PDF previously produced for a fingerprint
+
+        Returns:
+            Path of the PDF, or None if there is none or it has changed since
+        """
+        row = self.db.execute(
+            'SELECT pdf_path, ts FROM conversions WHERE fingerprint = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        pdf_path, ts = row
+        try:
+            if os.stat(pdf_path).st_mtime != ts:
+                return None
+        except OSError:
+            return None
+        return pdf_path
+
+    def store(self, entries):
+        """
+        Record the PDFs produced for a batch in one transaction
+
+        Args:
+            entries: Iterable of (fingerprint, pdf_path) pairs
+        """
+        rows = []
+        for key, pdf_path in entries:
+            try:
+                rows.append((key, os.path.abspath(pdf_path), os.stat(pdf_path).st_mtime))
+            except OSError:
+                continue
+        with self.db:
+            self.db.executemany('INSERT OR REPLACE INTO conversions VALUES (?, ?, ?)', rows)
@@ -8,9 +8,22 @@ Handles large files (450MB+) with high-quality format preservation
 import subprocess
 import sys
 import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
 from pathlib import Path
 import argparse
-from typing import List
+import atexit
+import contextlib
+import functools
+import mmap
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List
 
 # Try to import PowerPoint COM automation
 try:
@@ -20,36 +33,318 @@ except ImportError:
     POWERPOINT_AVAILABLE = False
     PowerPointConverter = None
 
+# Try to import the image-only fast path (requires Pillow)
+try:
+    from image_converter import ImageOnlyConverter, is_pillow_available
+    IMAGE_FAST_PATH_AVAILABLE = is_pillow_available()
+except ImportError:
+    IMAGE_FAST_PATH_AVAILABLE = False
+    ImageOnlyConverter = None
+
+# Try to import the LibreOffice Python-UNO bridge (ships with LibreOffice,
+# importable from its bundled Python or the python3-uno distro package)
+try:
+    import uno
+    import unohelper
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    UNO_AVAILABLE = True
+except ImportError:
+    UNO_AVAILABLE = False
+
+
+def _mk_props(**kwargs):
+    """Build a tuple of UNO PropertyValues from keyword arguments"""
+    props = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+# File extensions accepted as PowerPoint input (compared lower-cased)
+PPTX_SUFFIXES = frozenset({'.pptx', '.ppt'})
+
+# Signature at the start of legacy .ppt (OLE compound) files
+_OLE_SIGNATURE = bytes.fromhex('D0CF11E0A1B11AE1')
+
+# A zip's end-of-central-directory record sits within the last 22 bytes plus
+# the maximum comment length
+_ZIP_EOCD_SIGNATURE = b'PK\x05\x06'
+_ZIP_EOCD_SEARCH = 22 + 65535
+
+# Where the last successful LibreOffice lookup is remembered between runs
+SOFFICE_CACHE_FILE = Path.home() / '.cache' / 'pptx2pdf' / 'soffice'
+
+# Warm LibreOffice profiles kept between runs, one per pool worker
+# (see init_profile_worker)
+PROFILE_POOL_DIR = Path.home() / '.cache' / 'pptx2pdf' / 'profiles'
+
+
+@functools.lru_cache(maxsize=8)
+def find_libreoffice(custom_path=None):
+    """
+    Find LibreOffice executable on the system
+
+    Checks, in order: custom_path, the PPTX2PDF_SOFFICE environment variable,
+    the on-disk cache from a previous run, common install locations and PATH.
+    Only PATH lookups are used, no soffice process is spawned.
+    """
+    if custom_path and os.path.exists(custom_path):
+        return custom_path
+
+    env_path = os.environ.get('PPTX2PDF_SOFFICE')
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    # Trust the cached path unless the binary changed after it was cached
+    try:
+        cached = SOFFICE_CACHE_FILE.read_text(encoding='utf-8').strip()
+        if cached and os.path.getmtime(cached) <= SOFFICE_CACHE_FILE.stat().st_mtime:
+            return cached
+    except OSError:
+        pass
+
+    # Common LibreOffice paths on Windows
+    common_paths = [
+        r"C:\Program Files\LibreOffice\program\soffice.exe",
+        r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+        r"C:\Program Files\LibreOffice 7\program\soffice.exe",
+        r"C:\Program Files\LibreOffice 24\program\soffice.exe",
+    ]
+
+    found = None
+    for path in common_paths:
+        if os.path.exists(path):
+            found = path
+            break
+
+    # Try command line (for Linux/Mac or if in PATH)
+    if found is None:
+        for cmd in ['soffice', 'libreoffice']:
+            found = shutil.which(cmd)
+            if found:
+                break
+
+    if found:
+        try:
+            SOFFICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            SOFFICE_CACHE_FILE.write_text(found, encoding='utf-8')
+        except OSError:
+            pass
+
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _staging_root() -> Path:
+    """
+    Per-process directory where soffice writes PDFs before they are moved into
+    place, removed when the process exits
+
+    Set PPTX2PDF_STAGING to put it on a tmpfs or other fast local disk.
+    """
+    base = os.environ.get('PPTX2PDF_STAGING') or tempfile.gettempdir()
+    staging = Path(base) / f"pptx2pdf-{os.getpid()}"
+    staging.mkdir(parents=True, exist_ok=True)
+    atexit.register(shutil.rmtree, staging, ignore_errors=True)
+    return staging
+
+
+def iter_pptx(root):
+    """
+    Recursively yield os.DirEntry objects for PowerPoint files under root
+
+    One os.scandir walk covers every suffix and letter case; the entries carry
+    the file type (and inode number) from the directory listing, so no extra
+    stat is needed to filter them.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Unreadable directory, same as rglob
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.is_file(follow_symlinks=False)
+                      and os.path.splitext(entry.name)[1].lower() in PPTX_SUFFIXES):
+                    yield entry
+
+
+def _is_valid_pptx(path) -> bool:
+    """
+    Cheap check that a file is a well-formed container before soffice sees it
+
+    .pptx files must end with a zip directory record; .ppt files must start
+    with the OLE signature. Only the pages holding those bytes are read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.path.splitext(os.fspath(path))[1].lower() == '.ppt':
+                return f.read(len(_OLE_SIGNATURE)) == _OLE_SIGNATURE
+            # mmap raises ValueError for an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.rfind(_ZIP_EOCD_SIGNATURE, max(0, len(mm) - _ZIP_EOCD_SEARCH)) != -1
+    except (OSError, ValueError):
+        return False
+
+
+def parent_dir(path) -> str:
+    """Directory containing path, as a string usable for soffice --outdir"""
+    return os.path.dirname(os.fspath(path)) or os.curdir
+
+
+def is_up_to_date(input_stat, pdf_path) -> bool:
+    """
+    Check whether a PDF exists, is not empty and is at least as new as its source
+
+    Args:
+        input_stat: os.stat_result of the PPTX file
+        pdf_path: Path of the PDF that would be produced
+    """
+    try:
+        pdf_stat = os.stat(pdf_path)
+    except OSError:
+        return False
+    return pdf_stat.st_size > 0 and pdf_stat.st_mtime >= input_stat.st_mtime
+
+
+class _Prefetcher:
+    """
+    Background thread that asks the kernel to read upcoming input files into
+    the page cache (posix_fadvise WILLNEED) while earlier files are converting,
+    staying at most `ahead` files in front of the conversion cursor
+    """
+
+    def __init__(self, paths: List[Path], ahead: int):
+        self._paths = paths
+        self._ahead = ahead
+        self._cursor = 0
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def available():
+        """posix_fadvise exists on Linux and most other POSIX systems, not Windows"""
+        return hasattr(os, 'posix_fadvise')
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def advance(self, count: int = 1):
+        """Record that `count` more files have been handed to the converter"""
+        with self._condition:
+            self._cursor += count
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        for index, path in enumerate(self._paths):
+            with self._condition:
+                while not self._stopped and index >= self._cursor + self._ahead:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                if index < self._cursor:
+                    continue  # Already being converted, too late to help
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+
+def _chunk_by_dir(files: List[Path], out_dir_s: str, chunk_size: int):
+    """
+    Split files into chunks for one soffice run each
+
+    A run has a single --outdir, so when PDFs go next to their inputs the
+    files are grouped by parent directory first.
+
+    Returns:
+        List of (files, out_dir_s) tuples
+    """
+    groups = {}
+    for file_path in files:
+        groups.setdefault(out_dir_s or parent_dir(file_path), []).append(file_path)
+
+    chunks = []
+    for group_dir, group in groups.items():
+        for start in range(0, len(group), chunk_size):
+            chunks.append((group[start:start + chunk_size], group_dir))
+    return chunks
+
+
+def _describe(chunk: List[Path]) -> str:
+    """Name a chunk of files in a status message"""
+    return chunk[0].name if len(chunk) == 1 else f"{len(chunk)} files"
+
+
+@dataclass(frozen=True)
+class QualityPreset:
+    """PDF export settings for one quality level"""
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'dpi', 'jpeg_quality', 'description')
+
+    name: str
+    dpi: int
+    jpeg_quality: int
+    description: str
+
+
+# Quality presets matching PowerPoint export behavior
+QUALITY_PRESETS: Dict[str, QualityPreset] = {
+    'screen': QualityPreset(
+        name='Screen/Web (like PowerPoint)',
+        dpi=96,
+        jpeg_quality=80,
+        description='Smallest files, optimized for viewing on screen'
+    ),
+    'standard': QualityPreset(
+        name='Standard (Balanced)',
+        dpi=150,
+        jpeg_quality=85,
+        description='Good balance between quality and file size'
+    ),
+    'high': QualityPreset(
+        name='High Quality (Print)',
+        dpi=300,
+        jpeg_quality=90,
+        description='High quality for professional printing'
+    ),
+    'maximum': QualityPreset(
+        name='Maximum Quality (Archive)',
+        dpi=600,
+        jpeg_quality=95,
+        description='Highest quality, largest files'
+    )
+}
+
+
 class PPTXtoPDFConverter:
     # Quality presets matching PowerPoint export behavior
-    QUALITY_PRESETS = {
-        'screen': {
-            'name': 'Screen/Web (like PowerPoint)',
-            'dpi': 96,
-            'jpeg_quality': 80,
-            'description': 'Smallest files, optimized for viewing on screen'
-        },
-        'standard': {
-            'name': 'Standard (Balanced)',
-            'dpi': 150,
-            'jpeg_quality': 85,
-            'description': 'Good balance between quality and file size'
-        },
-        'high': {
-            'name': 'High Quality (Print)',
-            'dpi': 300,
-            'jpeg_quality': 90,
-            'description': 'High quality for professional printing'
-        },
-        'maximum': {
-            'name': 'Maximum Quality (Archive)',
-            'dpi': 600,
-            'jpeg_quality': 95,
-            'description': 'Highest quality, largest files'
-        }
-    }
+    QUALITY_PRESETS = QUALITY_PRESETS
+
+    # Seconds soffice may spend on one file (large decks take minutes)
+    SOFFICE_TIMEOUT = 600
 
-    def __init__(self, libreoffice_path=None, quality='standard', use_powerpoint=None):
+    def __init__(self, libreoffice_path=None, quality='standard', use_powerpoint=None,
+                 use_server=False, restart_every=50, fast_image_mode=False):
         """
         Initialize converter
 
@@ -57,8 +352,13 @@ class PPTXtoPDFConverter:
             libreoffice_path: Custom path to LibreOffice executable (optional)
             quality: Quality preset (screen, standard, high, maximum)
             use_powerpoint: Force PowerPoint (True), LibreOffice (False), or auto-detect (None)
+            use_server: Keep one LibreOffice instance running and convert over UNO
+            restart_every: Restart the LibreOffice server after this many files
+            fast_image_mode: Convert decks made only of full-slide pictures with
+                Pillow instead of the conversion engine
         """
-        self.quality = quality if quality in self.QUALITY_PRESETS else 'standard'
+        self.quality = quality if quality in QUALITY_PRESETS else 'standard'
+        self._preset = QUALITY_PRESETS[self.quality]
 
         # Determine which converter to use
         if use_powerpoint is None:
@@ -82,38 +382,295 @@ class PPTXtoPDFConverter:
             self.engine = 'LibreOffice'
             self.powerpoint_converter = None
 
-    def _find_libreoffice(self, custom_path=None):
-        """Find LibreOffice executable on the system"""
-        if custom_path and os.path.exists(custom_path):
-            return custom_path
-
-        # Common LibreOffice paths on Windows
-        common_paths = [
-            r"C:\Program Files\LibreOffice\program\soffice.exe",
-            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-            r"C:\Program Files\LibreOffice 7\program\soffice.exe",
-            r"C:\Program Files\LibreOffice 24\program\soffice.exe",
+        # Image-only fast path
+        self.image_converter = None
+        if fast_image_mode:
+            if IMAGE_FAST_PATH_AVAILABLE:
+                self.image_converter = ImageOnlyConverter(self._preset.dpi, self._preset.jpeg_quality)
+            else:
+                print("Warning: Image-only fast path requires Pillow (pip install Pillow)")
+
+        # Status output: per-thread line buffers, optionally drained by one writer thread
+        self._status = threading.local()
+        self._status_queue = None
+
+        # Scratch directory for private profiles and staged output, when the
+        # caller manages one (defaults to the system temp dir)
+        self.work_dir = None
+
+        # Slot of a persistent profile in PROFILE_POOL_DIR to use instead of
+        # creating private profiles (set in pool workers)
+        self.profile_slot = None
+
+        # Private LibreOffice profiles created for concurrent soffice processes
+        self._profile_dirs = set()
+        self._profile_lock = threading.Lock()
+
+        # Persistent LibreOffice server (UNO bridge)
+        self.restart_every = restart_every
+        self._server_process = None
+        self._server_profile = None
+        self._desktop = None
+        self._server_conversions = 0
+
+        if use_server and not self.use_powerpoint and self.libreoffice_path:
+            if UNO_AVAILABLE:
+                try:
+                    self._start_soffice_server()
+                except Exception as e:
+                    print(f"Warning: LibreOffice server failed to start: {e}")
+                    print("Falling back to one LibreOffice process per file")
+                    self._stop_soffice_server()
+            else:
+                print("Warning: Python-UNO bridge not available (run with LibreOffice's Python)")
+                print("Falling back to one LibreOffice process per file")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the persistent LibreOffice server, if one is running"""
+        self._stop_soffice_server()
+
+    def _start_soffice_server(self):
+        """Launch a headless LibreOffice listening on a local socket and connect to it"""
+        # Pick a free local port so several converters can run side by side
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('localhost', 0))
+            port = sock.getsockname()[1]
+
+        self._server_profile = Path(tempfile.mkdtemp(prefix='pptx2pdf_uno_'))
+        connection = f"socket,host=localhost,port={port};urp;"
+        cmd = [
+            str(self.libreoffice_path),
+            '--headless',
+            '--invisible',
+            '--norestore',
+            '--nologo',
+            f"-env:UserInstallation={self._server_profile.as_uri()}",
+            f"--accept={connection}StarOffice.ComponentContext",
         ]
+        self._server_process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
 
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
+        # Poll the socket until LibreOffice has finished starting up
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context)
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}StarOffice.ComponentContext")
+                break
+            except NoConnectException:
+                if self._server_process.poll() is not None:
+                    raise RuntimeError("LibreOffice exited during startup")
+                if time.monotonic() > deadline:
+                    raise RuntimeError("timed out waiting for LibreOffice to start")
+                time.sleep(0.25)
 
-        # Try command line (for Linux/Mac or if in PATH)
-        for cmd in ['soffice', 'libreoffice']:
+        self._service_manager = context.ServiceManager
+        self._desktop = self._service_manager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context)
+        self._server_conversions = 0
+
+    def _stop_soffice_server(self):
+        """Terminate the persistent LibreOffice server and remove its profile"""
+        asked_to_exit = False
+        if self._desktop is not None:
             try:
-                result = subprocess.run([cmd, '--version'],
-                                       capture_output=True,
-                                       text=True,
-                                       timeout=5)
-                if result.returncode == 0:
-                    return cmd
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
+                self._desktop.terminate()
+                asked_to_exit = True
+            except Exception:
+                pass
+            self._desktop = None
 
-        return None
+        if self._server_process is not None:
+            if not asked_to_exit:
+                # No UNO connection (e.g. the server failed to start): signal
+                # the process itself instead of waiting out the timeout
+                self._server_process.terminate()
+            try:
+                self._server_process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._server_process.kill()
+                self._server_process.wait()
+            self._server_process = None
+
+        if self._server_profile is not None:
+            shutil.rmtree(self._server_profile, ignore_errors=True)
+            self._server_profile = None
 
-    def convert_file(self, input_file: str, output_dir: str = None, verbose: bool = True):
+    def _convert_via_server(self, input_path: Path, pdf_path: str, dpi: int, jpeg_quality: int):
+        """Convert one presentation through the persistent LibreOffice server"""
+        # LibreOffice leaks memory over long runs, so recycle it periodically
+        if self.restart_every and self._server_conversions >= self.restart_every:
+            self._stop_soffice_server()
+            self._start_soffice_server()
+        self._server_conversions += 1
+
+        document = self._desktop.loadComponentFromURL(
+            unohelper.systemPathToFileUrl(os.path.abspath(input_path)),
+            "_blank",
+            0,
+            _mk_props(Hidden=True, ReadOnly=True)
+        )
+        if document is None:
+            raise RuntimeError("LibreOffice could not open the file")
+
+        try:
+            filter_data = uno.Any(
+                "[]com.sun.star.beans.PropertyValue",
+                _mk_props(
+                    Quality=jpeg_quality,
+                    ReduceImageResolution=True,
+                    MaxImageResolution=dpi
+                )
+            )
+            store_props = _mk_props(FilterName="impress_pdf_Export")
+            filter_prop = PropertyValue()
+            filter_prop.Name = "FilterData"
+            filter_prop.Value = filter_data
+            # uno.invoke is required to pass the typed FilterData sequence
+            uno.invoke(
+                document,
+                "storeToURL",
+                (unohelper.systemPathToFileUrl(os.path.abspath(pdf_path)), store_props + (filter_prop,))
+            )
+        finally:
+            document.close(True)
+
+    def _say(self, message=''):
+        """Print a status line, buffered while inside a _status_block"""
+        lines = getattr(self._status, 'lines', None)
+        if lines is not None:
+            lines.append(message)
+        else:
+            self._write(message + '\n')
+
+    def _write(self, text):
+        """Write pre-formatted status text to stdout in a single call"""
+        status_queue = self._status_queue
+        if status_queue is not None:
+            status_queue.put(text)
+        elif sys.stdout is not None:  # None under pythonw and its worker processes
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    @contextlib.contextmanager
+    def _status_block(self):
+        """Collect the status lines of one file (or chunk) and write them at once"""
+        if getattr(self._status, 'lines', None) is not None:
+            yield  # Already inside a block on this thread
+            return
+        self._status.lines = []
+        try:
+            yield
+        finally:
+            lines, self._status.lines = self._status.lines, None
+            if lines:
+                self._write('\n'.join(lines) + '\n')
+
+    @contextlib.contextmanager
+    def _status_writer(self):
+        """Hand status output to a single writer thread while worker threads run"""
+        status_queue = queue.Queue()
+
+        def drain():
+            while True:
+                text = status_queue.get()
+                if text is None:
+                    break
+                sys.stdout.write(text)
+                if status_queue.empty():
+                    sys.stdout.flush()
+            sys.stdout.flush()
+
+        writer = threading.Thread(target=drain, daemon=True)
+        writer.start()
+        self._status_queue = status_queue
+        try:
+            yield
+        finally:
+            self._status_queue = None
+            status_queue.put(None)
+            writer.join()
+
+    def _profile_arg(self, key):
+        """Return a -env:UserInstallation argument for a private profile named by key"""
+        if self.profile_slot is not None:
+            # Never removed, so later runs skip LibreOffice's first-start setup
+            profile_dir = PROFILE_POOL_DIR / str(self.profile_slot)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            return f"-env:UserInstallation={profile_dir.as_uri()}"
+
+        profile_dir = Path(self.work_dir or tempfile.gettempdir()) / f"lo_prof_{os.getpid()}_{key}"
+        with self._profile_lock:
+            self._profile_dirs.add(profile_dir)
+        return f"-env:UserInstallation={profile_dir.as_uri()}"
+
+    def _cleanup_profiles(self):
+        """Remove the private LibreOffice profiles created for a batch"""
+        with self._profile_lock:
+            profile_dirs, self._profile_dirs = self._profile_dirs, set()
+        for profile_dir in profile_dirs:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    def _find_libreoffice(self, custom_path=None):
+        """Find LibreOffice executable on the system"""
+        return find_libreoffice(custom_path)
+
+    def _prepare(self, input_file: str, output_dir: str = None):
+        """
+        Validate an input file and resolve its output directory
+
+        Returns:
+            (input_path, out_dir_s) tuple, or None if the file can't be converted
+        """
+        input_path = Path(input_file)
+
+        if not input_path.exists():
+            self._say(f"ERROR: File not found: {input_file}")
+            return None
+
+        if input_path.suffix.lower() not in PPTX_SUFFIXES:
+            self._say(f"WARNING: {input_file} is not a PowerPoint file, skipping...")
+            return None
+
+        # Set output directory
+        if output_dir:
+            out_dir = Path(output_dir)
+            out_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            out_dir = input_path.parent
+
+        return input_path, os.fspath(out_dir)
+
+    def _announce(self, input_path: Path, input_size: int = None):
+        """Print the Converting line for a file, using input_size (bytes) when already known"""
+        if input_size is None:
+            input_size = os.stat(input_path).st_size
+        self._say(f"Converting: {input_path.name} ({input_size / (1024 * 1024):.2f} MB)")
+
+    def _check_output(self, input_path: Path, pdf_path: str, verbose: bool = True):
+        """Report whether LibreOffice produced the expected PDF"""
+        try:
+            pdf_size = os.stat(pdf_path).st_size / (1024 * 1024)
+        except FileNotFoundError:
+            self._say(f"✗ Failed: PDF not created for {input_path.name}")
+            return False
+        if verbose:
+            self._say(f"✓ Success: {os.path.basename(pdf_path)} ({pdf_size:.2f} MB)")
+        return True
+
+    def convert_file(self, input_file: str, output_dir: str = None, verbose: bool = True,
+                     input_size: int = None):
         """
         Convert a single PPTX file to PDF
 
@@ -121,6 +678,7 @@ class PPTXtoPDFConverter:
             input_file: Path to PPTX file
             output_dir: Output directory (defaults to same as input)
             verbose: Print conversion status
+            input_size: Size of the input in bytes, if the caller already has it
 
         Returns:
             True if successful, False otherwise
@@ -131,89 +689,411 @@ class PPTXtoPDFConverter:
 
         # Fall back to LibreOffice
         if not self.libreoffice_path:
-            print("ERROR: LibreOffice not found. Please install LibreOffice first.")
+            self._say("ERROR: LibreOffice not found. Please install LibreOffice first.")
             return False
 
-        input_path = Path(input_file)
+        with self._status_block():
+            prepared = self._prepare(input_file, output_dir)
+            if prepared is None:
+                return False
+            if self.image_converter and self._try_fast_image(*prepared, verbose, input_size):
+                return True
+            return self._convert_one(*prepared, verbose, input_size)
 
-        if not input_path.exists():
-            print(f"ERROR: File not found: {input_file}")
-            return False
+    def _try_fast_image(self, input_path: Path, out_dir_s: str, verbose: bool = True,
+                        input_size: int = None, header: str = None):
+        """
+        Convert an image-only deck without the conversion engine
 
-        if input_path.suffix.lower() not in ['.pptx', '.ppt']:
-            print(f"WARNING: {input_file} is not a PowerPoint file, skipping...")
+        Args:
+            header: Optional progress line to print first if the deck is converted
+
+        Returns:
+            True if converted, False if the file needs the regular engine
+        """
+        pdf_path = out_dir_s + os.sep + input_path.stem + '.pdf'
+        try:
+            if not self.image_converter.try_convert(os.fspath(input_path), pdf_path):
+                return False
+        except Exception as e:
+            if verbose:
+                self._say(f"Image-only fast path failed for {input_path.name}: {str(e)}")
             return False
 
-        # Set output directory
-        if output_dir:
-            out_dir = Path(output_dir)
-            out_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            out_dir = input_path.parent
+        if header:
+            self._say(header)
+        if verbose:
+            self._announce(input_path, input_size)
+            self._say("Image-only deck: converted without the conversion engine")
+        return self._check_output(input_path, pdf_path, verbose)
+
+    def _convert_one(self, input_path: Path, out_dir_s: str, verbose: bool = True,
+                     input_size: int = None):
+        """
+        Convert a file that has already been validated (by _prepare or by the
+        batch enumeration) into an existing output directory
+
+        Args:
+            input_path: Path to PPTX file
+            out_dir_s: Output directory as a string
+            verbose: Print conversion status
+            input_size: Size of the input in bytes, if already known
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.use_powerpoint and self.powerpoint_converter:
+            return self.powerpoint_converter.convert_file(os.fspath(input_path), out_dir_s, verbose)
 
         if verbose:
-            file_size = input_path.stat().st_size / (1024 * 1024)  # MB
-            print(f"Converting: {input_path.name} ({file_size:.2f} MB)")
+            self._announce(input_path, input_size)
+
+        if self._desktop is not None:
+            return self._convert_file_via_server(input_path, out_dir_s, verbose)
 
+        return self._convert_chunk([input_path], out_dir_s, verbose)[input_path]
+
+    def _convert_file_via_server(self, input_path: Path, out_dir_s: str, verbose: bool = True):
+        """Convert one prepared file through the persistent LibreOffice server"""
         try:
-            # Get quality settings
-            preset = self.QUALITY_PRESETS[self.quality]
-            dpi = preset['dpi']
-            jpeg_quality = preset['jpeg_quality']
+            # The persistent server takes FilterData, so quality presets apply there
+            preset = self._preset
 
+            if verbose:
+                self._say(f"Quality: {preset.name} ({preset.dpi} DPI, JPEG {preset.jpeg_quality}%)")
+
+            pdf_path = out_dir_s + os.sep + input_path.stem + '.pdf'
+            self._convert_via_server(input_path, pdf_path, preset.dpi, preset.jpeg_quality)
+            return self._check_output(input_path, pdf_path, verbose)
+
+        except Exception as e:
+            self._say(f"✗ Error converting {input_path.name}: {str(e)}")
+            return False
+
+    def _start_soffice(self, chunk: List[Path], out_dir_s: str, verbose: bool = True, profile_key=None):
+        """
+        Launch soffice for one or more prepared files without waiting for it
+
+        soffice converts every input given on its command line in a single run,
+        so passing several files pays LibreOffice's startup cost only once.
+
+        Args:
+            chunk: Files to convert, all written to out_dir_s
+            profile_key: Use a private LibreOffice profile identified by this key
+                (needed whenever several soffice processes run at once)
+
+        Returns:
+            (Popen, stderr_file, start_time, staging_dir) tuple, or None if
+            soffice could not be started
+        """
+        try:
             # IMPORTANT LIMITATION: LibreOffice command-line doesn't support FilterData parameters
             # The --convert-to option doesn't accept JSON or key=value filter options reliably
             # This is a known limitation of soffice CLI across platforms
             # For now, using standard PDF export - quality presets have no effect
-            # TODO: Implement via LibreOffice Python-UNO bridge or macro for true quality control
+            # Use the persistent server (--server) for true quality control
 
             filter_str = 'pdf'  # Standard PDF export
 
+            # soffice writes into a private staging directory; finished PDFs
+            # are moved to out_dir_s so slow destinations don't stall it
+            staging_root = Path(self.work_dir) / f"pptx2pdf-{os.getpid()}" if self.work_dir else _staging_root()
+            staging_dir = staging_root / str(profile_key if profile_key is not None else threading.get_ident())
+            staging_dir.mkdir(parents=True, exist_ok=True)
+            for leftover in os.scandir(staging_dir):
+                os.remove(leftover.path)
+            staging_dir = os.fspath(staging_dir)
+
             # LibreOffice command for conversion
             cmd = [
                 str(self.libreoffice_path),
                 '--headless',
+                '--norestore',
+                '--nolockcheck',
+                '--nodefault',
+                '--nofirststartwizard',
                 '--convert-to', filter_str,
-                '--outdir', str(out_dir),
-                str(input_path)
+                '--outdir', staging_dir,
             ]
+            cmd.extend(os.fspath(p) for p in chunk)
+
+            # Concurrent soffice processes must not share a profile: the second
+            # one would find the lock and hand its job to the first instance
+            if profile_key is not None:
+                cmd.insert(1, self._profile_arg(profile_key))
 
             if verbose:
-                print(f"Quality: {preset['name']} ({dpi} DPI)")
-                print(f"Note: Quality presets currently use LibreOffice defaults")
-                print(f"CLI filter options are not supported by soffice")
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout for large files
-            )
+                self._say(f"Quality: {self._preset.name} ({self._preset.dpi} DPI)")
+                self._say(f"Note: Quality presets currently use LibreOffice defaults")
+                self._say(f"CLI filter options are not supported by soffice (use --server)")
 
-            if result.returncode == 0:
-                pdf_path = out_dir / f"{input_path.stem}.pdf"
-                if pdf_path.exists():
-                    pdf_size = pdf_path.stat().st_size / (1024 * 1024)
-                    if verbose:
-                        print(f"✓ Success: {pdf_path.name} ({pdf_size:.2f} MB)")
-                    return True
-                else:
-                    print(f"✗ Failed: PDF not created for {input_path.name}")
-                    return False
-            else:
-                print(f"✗ Failed: {input_path.name}")
-                if verbose and result.stderr:
-                    print(f"  Error: {result.stderr}")
-                return False
+            # soffice can log megabytes on large decks; spool stderr to disk so
+            # memory stays bounded and only the tail is read back on failure
+            stderr_file = tempfile.TemporaryFile()
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file
+                )
+            except Exception:
+                stderr_file.close()
+                raise
+            return process, stderr_file, time.monotonic(), staging_dir
 
-        except subprocess.TimeoutExpired:
-            print(f"✗ Timeout: {input_path.name} (took longer than 10 minutes)")
-            return False
         except Exception as e:
-            print(f"✗ Error converting {input_path.name}: {str(e)}")
-            return False
+            self._say(f"✗ Error converting {_describe(chunk)}: {str(e)}")
+            return None
+
+    def _finish_soffice(self, handle, chunk: List[Path], out_dir_s: str, verbose: bool = True,
+                        profile_key=None):
+        """
+        Wait for a soffice process started by _start_soffice and check its output
+
+        Files a multi-file run left unconverted are retried in halves, so one
+        bad deck ends up failing on its own without taking the others with it.
+        A run is killed once no new PDF has appeared for SOFFICE_TIMEOUT
+        seconds; the files a timed-out run left are retried one per run, so
+        a hanging deck only costs one more timeout.
+
+        Returns:
+            Dictionary mapping each input path to True (converted) or False
+        """
+        process, stderr_file, start_time, staging_dir = handle
+        timeout = self.SOFFICE_TIMEOUT
+        # Counted from launch, and for multi-file runs again from each PDF
+        # soffice starts writing
+        deadline = start_time + timeout
+        produced = 0
+        timed_out = False
+        try:
+            while True:
+                try:
+                    process.wait(timeout=max(0, min(deadline - time.monotonic(), 5)))
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                if len(chunk) > 1:
+                    staged = sum(1 for entry in os.scandir(staging_dir) if entry.name.endswith('.pdf'))
+                    if staged > produced:
+                        produced = staged
+                        deadline = time.monotonic() + timeout
+                if time.monotonic() >= deadline:
+                    process.kill()
+                    process.wait()
+                    timed_out = True
+                    break
+
+            if len(chunk) == 1:
+                input_path = chunk[0]
+                if timed_out:
+                    self._say(f"✗ Timeout: {input_path.name} (took longer than {timeout // 60} minutes)")
+                    return {input_path: False}
+                if process.returncode == 0:
+                    pdf_path = self._collect_output(staging_dir, out_dir_s, input_path)
+                    if pdf_path is None:
+                        self._say(f"✗ Failed: PDF not created for {input_path.name}")
+                        return {input_path: False}
+                    return {input_path: self._check_output(input_path, pdf_path, verbose)}
+                self._say(f"✗ Failed: {input_path.name}")
+                if verbose:
+                    stderr = self._read_tail(stderr_file)
+                    if stderr:
+                        self._say(f"  Error: {stderr}")
+                return {input_path: False}
+
+            if timed_out:
+                self._say(f"✗ Timeout: {_describe(chunk)} (no progress for {timeout // 60} minutes)")
+
+            results = {}
+            missing = []
+            for input_path in chunk:
+                pdf_path = self._collect_output(staging_dir, out_dir_s, input_path)
+                if pdf_path is None:
+                    missing.append(input_path)
+                    continue
+                pdf_stat = os.stat(pdf_path)
+                results[input_path] = True
+                if verbose:
+                    self._say(f"✓ Success: {input_path.stem}.pdf ({pdf_stat.st_size / (1024 * 1024):.2f} MB)")
+
+        except Exception as e:
+            self._say(f"✗ Error converting {_describe(chunk)}: {str(e)}")
+            return dict.fromkeys(chunk, False)
+        finally:
+            stderr_file.close()
+
+        if missing and timed_out:
+            # Halving would wait out the hanging deck once per level
+            if verbose:
+                self._say(f"Retrying {len(missing)} file(s) one at a time...")
+            for input_path in missing:
+                results.update(self._convert_chunk([input_path], out_dir_s, verbose, profile_key))
+        elif missing:
+            if verbose:
+                self._say(f"Retrying {len(missing)} file(s) in smaller groups...")
+            results.update(self._convert_chunk(missing, out_dir_s, verbose, profile_key, split=True))
+        return results
+
+    @staticmethod
+    def _collect_output(staging_dir: str, out_dir_s: str, input_path: Path):
+        """
+        Move the PDF soffice wrote for input_path from staging into out_dir_s
+
+        Returns:
+            Final PDF path, or None if soffice didn't create it
+        """
+        staged = staging_dir + os.sep + input_path.stem + '.pdf'
+        pdf_path = out_dir_s + os.sep + input_path.stem + '.pdf'
+        try:
+            os.replace(staged, pdf_path)  # Same filesystem: metadata-only rename
+        except FileNotFoundError:
+            return None
+        except OSError:
+            shutil.move(staged, pdf_path)  # Different filesystem: one sequential copy
+        return pdf_path
+
+    def _convert_chunk(self, chunk: List[Path], out_dir_s: str, verbose: bool = True,
+                       profile_key=None, split: bool = False):
+        """
+        Convert a group of prepared files with a single soffice run
+
+        Args:
+            chunk: Files to convert, all written to out_dir_s
+            profile_key: Private LibreOffice profile key (see _start_soffice)
+            split: Divide the chunk in two halves first (used for retries)
+
+        Returns:
+            Dictionary mapping each input path to True (converted) or False
+        """
+        if split and len(chunk) > 1:
+            middle = len(chunk) // 2
+            results = self._convert_chunk(chunk[:middle], out_dir_s, verbose, profile_key, split=False)
+            results.update(self._convert_chunk(chunk[middle:], out_dir_s, verbose, profile_key, split=False))
+            return results
+
+        handle = self._start_soffice(chunk, out_dir_s, verbose, profile_key)
+        if handle is None:
+            return dict.fromkeys(chunk, False)
+        return self._finish_soffice(handle, chunk, out_dir_s, verbose, profile_key)
+
+    @staticmethod
+    def _read_tail(stream, limit=8192):
+        """Return the last `limit` bytes written to a spooled output file as text"""
+        stream.seek(0, os.SEEK_END)
+        stream.seek(max(0, stream.tell() - limit))
+        return stream.read().decode(errors='replace').strip()
+
+    def _convert_pipelined(self, chunks, total_files: int, verbose: bool = True, depth: int = 2,
+                           prefetcher=None, sizes=None, numbered: int = 0):
+        """
+        Convert chunks one after another, keeping up to `depth` soffice processes
+        in flight so the next chunk's startup overlaps the previous one's export
 
-    def convert_batch(self, input_paths: List[str], output_dir: str = None, verbose: bool = True):
+        Args:
+            chunks: List of (files, out_dir_s) tuples from _chunk_by_dir
+            total_files: Number of files in the batch, for progress output
+            prefetcher: Optional _Prefetcher to advance as chunks start
+            sizes: Optional mapping of input path to size in bytes, for the Converting lines
+            numbered: Files of the batch already numbered in the progress output
+
+        Returns:
+            (success_count, failed_count) tuple
+        """
+        in_flight = deque()
+        free_slots = deque(range(depth))
+        success_count = 0
+        failed_count = 0
+        started = numbered
+
+        def reap():
+            nonlocal success_count, failed_count
+            handle, chunk, chunk_out_dir, slot = in_flight.popleft()
+            with self._status_block():
+                results = self._finish_soffice(handle, chunk, chunk_out_dir, verbose, slot if depth > 1 else None)
+            free_slots.append(slot)
+            converted = sum(results.values())
+            success_count += converted
+            failed_count += len(results) - converted
+
+        for chunk, chunk_out_dir in chunks:
+            # Wait for the oldest conversion once the window is full
+            if not free_slots:
+                reap()
+
+            first = started + 1
+            started += len(chunk)
+            if prefetcher:
+                prefetcher.advance(len(chunk))
+            slot = free_slots.popleft()
+            profile_key = slot if depth > 1 else None
+            with self._status_block():
+                if len(chunk) == 1:
+                    self._say(f"\n[{first}/{total_files}]")
+                else:
+                    self._say(f"\n[{first}-{started}/{total_files}]")
+                if verbose:
+                    for file_path in chunk:
+                        self._announce(file_path, sizes.get(file_path) if sizes else None)
+                handle = self._start_soffice(chunk, chunk_out_dir, verbose, profile_key)
+            if handle is None:
+                free_slots.appendleft(slot)
+                failed_count += len(chunk)
+                continue
+            in_flight.append((handle, chunk, chunk_out_dir, slot))
+
+        while in_flight:
+            reap()
+
+        return success_count, failed_count
+
+    def _convert_parallel(self, chunks, total_files: int, verbose: bool = True, jobs: int = 2,
+                          prefetcher=None, sizes=None, numbered: int = 0):
+        """
+        Convert chunks on a pool of `jobs` threads, each driving its own soffice
+        process with a private LibreOffice profile
+
+        Args:
+            chunks: List of (files, out_dir_s) tuples from _chunk_by_dir
+            total_files: Number of files in the batch, for progress output
+            prefetcher: Optional _Prefetcher to advance as chunks start
+            sizes: Optional mapping of input path to size in bytes, for the Converting lines
+            numbered: Files of the batch already numbered in the progress output
+
+        Returns:
+            (success_count, failed_count) tuple
+        """
+        def work(chunk, chunk_out_dir):
+            if prefetcher:
+                prefetcher.advance(len(chunk))
+            with self._status_block():
+                if verbose:
+                    for file_path in chunk:
+                        self._announce(file_path, sizes.get(file_path) if sizes else None)
+                return self._convert_chunk(chunk, chunk_out_dir, verbose, threading.get_ident())
+
+        self._say(f"Running {jobs} conversions in parallel")
+        success_count = 0
+        failed_count = 0
+        done = numbered
+        with self._status_writer(), ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(work, chunk, chunk_out_dir) for chunk, chunk_out_dir in chunks]
+            for future in as_completed(futures):
+                lines = []
+                for file_path, ok in future.result().items():
+                    done += 1
+                    if ok:
+                        success_count += 1
+                        lines.append(f"\n[{done}/{total_files}] Done: {file_path.name}")
+                    else:
+                        failed_count += 1
+                        lines.append(f"\n[{done}/{total_files}] Failed: {file_path.name}")
+                self._write('\n'.join(lines) + '\n')
+        return success_count, failed_count
+
+    def convert_batch(self, input_paths: List[str], output_dir: str = None, verbose: bool = True,
+                      jobs: int = None, pipeline_depth: int = 2, chunk_size: int = 16,
+                      incremental: bool = False):
         """
         Convert multiple PPTX files to PDF
 
@@ -221,54 +1101,279 @@ class PPTXtoPDFConverter:
             input_paths: List of file paths or directories
             output_dir: Output directory (defaults to same as input)
             verbose: Print conversion status
+            jobs: Number of parallel conversions (defaults to one per CPU core)
+            pipeline_depth: soffice processes kept in flight when jobs is 1
+            chunk_size: Most files passed to each LibreOffice run
+            incremental: Skip files whose PDF is already up to date
 
         Returns:
             Dictionary with success/failure counts
         """
-        files_to_convert = []
+        # (path, os.stat_result) for all PPTX files; the stat is taken once here
+        # and reused for the incremental check and the Converting lines
+        found = []
 
         # Collect all PPTX files
         for path in input_paths:
             p = Path(path)
-            if p.is_file() and p.suffix.lower() in ['.pptx', '.ppt']:
-                files_to_convert.append(p)
+            if p.is_file() and p.suffix.lower() in PPTX_SUFFIXES:
+                found.append((p, os.stat(p)))
             elif p.is_dir():
                 # Recursively find all PPTX files in directory
-                files_to_convert.extend(p.rglob('*.pptx'))
-                files_to_convert.extend(p.rglob('*.ppt'))
-                files_to_convert.extend(p.rglob('*.PPTX'))
-                files_to_convert.extend(p.rglob('*.PPT'))
+                entries = list(iter_pptx(p))
+                # Inode order follows on-disk layout on most Linux filesystems,
+                # which keeps LibreOffice's reads sequential
+                if sys.platform.startswith('linux'):
+                    entries.sort(key=lambda entry: entry.inode())
+                found.extend((Path(entry.path), entry.stat(follow_symlinks=False)) for entry in entries)
 
-        if not files_to_convert:
+        if not found:
             print("No PPTX files found to convert.")
-            return {'total': 0, 'success': 0, 'failed': 0}
+            return {'total': 0, 'success': 0, 'failed': 0, 'skipped': 0}
+
+        out_dir_s = os.fspath(Path(output_dir)) if output_dir else None
+
+        # Skip inputs whose PDF is already newer
+        if incremental:
+            files_to_convert = []
+            for file_path, input_stat in found:
+                pdf_path = (out_dir_s or parent_dir(file_path)) + os.sep + file_path.stem + '.pdf'
+                if not is_up_to_date(input_stat, pdf_path):
+                    files_to_convert.append(file_path)
+        else:
+            files_to_convert = [file_path for file_path, _ in found]
+        skipped_count = len(found) - len(files_to_convert)
+        sizes = {file_path: input_stat.st_size for file_path, input_stat in found} if verbose else None
 
-        print(f"\nFound {len(files_to_convert)} file(s) to convert\n")
+        print(f"\nFound {len(found)} file(s) to convert\n")
+        if skipped_count:
+            print(f"Skipping {skipped_count} file(s) with an up-to-date PDF\n")
         print("=" * 60)
 
+        if not files_to_convert:
+            print("\nAll PDFs are up to date.")
+            return {'total': len(found), 'success': 0, 'failed': 0, 'skipped': skipped_count}
+
+        if not self.use_powerpoint and not self.libreoffice_path:
+            print("ERROR: LibreOffice not found. Please install LibreOffice first.")
+            return {'total': len(found), 'success': 0, 'failed': len(files_to_convert),
+                    'skipped': skipped_count}
+
+        # Resolve the output directory once for the whole batch
+        if out_dir_s:
+            Path(out_dir_s).mkdir(parents=True, exist_ok=True)
+
         success_count = 0
         failed_count = 0
+        # Files dropped before the engine still take their [i/N] entry
+        batch_total = len(files_to_convert)
+        numbered = 0
 
-        for i, file_path in enumerate(files_to_convert, 1):
-            print(f"\n[{i}/{len(files_to_convert)}]")
-            if self.convert_file(str(file_path), output_dir, verbose):
-                success_count += 1
+        # Corrupt or empty files would each cost a LibreOffice run to fail
+        valid = []
+        for file_path in files_to_convert:
+            if _is_valid_pptx(file_path):
+                valid.append(file_path)
             else:
+                numbered += 1
+                kind = "PowerPoint file" if file_path.suffix.lower() == '.ppt' else "OOXML archive"
+                self._say(f"\n[{numbered}/{batch_total}]")
+                self._say(f"✗ Skipped {file_path.name}: not a valid {kind}")
                 failed_count += 1
+        files_to_convert = valid
+
+        # Picture-only decks are written directly; the rest go to the engine
+        if self.image_converter:
+            remaining = []
+            for file_path in files_to_convert:
+                with self._status_block():
+                    converted = self._try_fast_image(file_path, out_dir_s or parent_dir(file_path), verbose,
+                                                     sizes.get(file_path) if sizes else None,
+                                                     f"\n[{numbered + 1}/{batch_total}]")
+                if converted:
+                    numbered += 1
+                    success_count += 1
+                else:
+                    remaining.append(file_path)
+            if len(remaining) < len(files_to_convert):
+                self._say(f"\nConverted {len(files_to_convert) - len(remaining)} image-only file(s) directly")
+            files_to_convert = remaining
+
+        # PowerPoint COM automation is single-apartment and the LibreOffice
+        # server loads one document at a time, so both run one file at a time
+        serial = self.use_powerpoint or self._desktop is not None
+        if serial:
+            order = files_to_convert
+        else:
+            # Smaller chunks when there are too few files to give every
+            # worker (or every pipelined process) a full one
+            workers = jobs if jobs is not None else os.cpu_count() or 1
+            if workers <= 1:
+                workers = max(1, pipeline_depth)
+            chunk_size = max(1, min(chunk_size, -(-len(files_to_convert) // workers)))
+            chunks = _chunk_by_dir(files_to_convert, out_dir_s, chunk_size)
+            order = [file_path for chunk, _ in chunks for file_path in chunk]
+            if jobs is None:
+                jobs = min(os.cpu_count() or 1, len(chunks))
+
+        # Warm the page cache for upcoming inputs (matters most on network shares)
+        prefetcher = None
+        if _Prefetcher.available() and order:
+            prefetcher = _Prefetcher(order, 2 * (1 if serial else max(1, jobs))).start()
+
+        try:
+            if serial:
+                for i, file_path in enumerate(files_to_convert, numbered + 1):
+                    if prefetcher:
+                        prefetcher.advance()
+                    # One file at a time, so lines are written as they come:
+                    # the header and Converting line show before a long
+                    # conversion, and PowerPoint's own prints stay in order
+                    self._say(f"\n[{i}/{batch_total}]")
+                    ok = self._convert_one(file_path, out_dir_s or parent_dir(file_path), verbose,
+                                           sizes.get(file_path) if sizes else None)
+                    if ok:
+                        success_count += 1
+                    else:
+                        failed_count += 1
+            elif chunks:
+                if jobs <= 1:
+                    converted, failed = self._convert_pipelined(
+                        chunks, batch_total, verbose, max(1, pipeline_depth), prefetcher, sizes, numbered)
+                else:
+                    converted, failed = self._convert_parallel(
+                        chunks, batch_total, verbose, jobs, prefetcher, sizes, numbered)
+                success_count += converted
+                failed_count += failed
+        finally:
+            self._cleanup_profiles()
+            if prefetcher:
+                prefetcher.stop()
 
         print("\n" + "=" * 60)
         print(f"\nConversion Summary:")
-        print(f"  Total files: {len(files_to_convert)}")
+        print(f"  Total files: {len(found)}")
         print(f"  Successful: {success_count}")
         print(f"  Failed: {failed_count}")
+        if skipped_count:
+            print(f"  Skipped (up to date): {skipped_count}")
 
         return {
-            'total': len(files_to_convert),
+            'total': len(found),
             'success': success_count,
-            'failed': failed_count
+            'failed': failed_count,
+            'skipped': skipped_count
         }
 
 
+# Persistent profile slot claimed by this worker process, and the open lock
+# file that holds it (see init_profile_worker)
+_worker_profile_slot = None
+_worker_profile_lock = None
+
+
+def _lock_profile_slot(slot):
+    """
+    Take an exclusive lock on a pooled profile, held until the file is closed
+    or the process exits (so a crashed worker never leaves it locked)
+
+    Returns:
+        The open lock file, or None if another process holds the profile
+    """
+    try:
+        PROFILE_POOL_DIR.mkdir(parents=True, exist_ok=True)
+        lock_file = open(PROFILE_POOL_DIR / f"{slot}.lock", 'a+b')
+    except OSError:
+        return None
+    try:
+        if sys.platform == 'win32':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def init_profile_worker(slots):
+    """
+    ProcessPoolExecutor initializer: claim one of the persistent profiles
+    in PROFILE_POOL_DIR for the lifetime of the worker process
+
+    If another process (e.g. a second GUI window) is using the slot's
+    profile, the worker falls back to a temporary profile under work_dir:
+    soffice processes sharing a profile hand their jobs to each other.
+
+    Args:
+        slots: multiprocessing.Queue holding one slot number per worker
+    """
+    global _worker_profile_slot, _worker_profile_lock
+    slot = slots.get()
+    _worker_profile_lock = _lock_profile_slot(slot)
+    _worker_profile_slot = slot if _worker_profile_lock is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_converter(libreoffice_path, quality, work_dir, profile_slot):
+    """LibreOffice converter for the current worker process, reused across its files"""
+    converter = PPTXtoPDFConverter(libreoffice_path, quality, use_powerpoint=False)
+    converter.work_dir = work_dir
+    converter.profile_slot = profile_slot
+    return converter
+
+
+def convert_files_worker(input_files: List[str], output_dir: str, quality: str,
+                         libreoffice_path: str = None, work_dir: str = None):
+    """
+    Convert a group of files with LibreOffice inside a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it. Files sharing an output
+    directory go to a single soffice run; any it leaves unconverted are
+    retried in smaller groups, so one bad deck doesn't fail the others. Every
+    worker process runs soffice with its own profile (its pooled one if the
+    pool was started with init_profile_worker, else one under work_dir) and
+    its own staging folder under work_dir; worker processes skip exit
+    handlers, so the caller removes work_dir once the pool has shut down.
+
+    Args:
+        input_files: Paths to PPTX files
+        output_dir: Output directory (defaults to same as input)
+        quality: Quality preset name
+        libreoffice_path: LibreOffice executable already found by the caller
+        work_dir: Scratch directory for the worker's profile and staged output
+
+    Returns:
+        List of (input_file, success, error message or None) tuples, in input order
+    """
+    try:
+        converter = _worker_converter(libreoffice_path, quality, work_dir, _worker_profile_slot)
+        if not converter.libreoffice_path:
+            return [(input_file, False, "LibreOffice not found") for input_file in input_files]
+
+        results = {}
+        groups = {}
+        for input_file in input_files:
+            prepared = converter._prepare(input_file, output_dir)
+            if prepared is None:
+                results[input_file] = (input_file, False, "File not found or not a PowerPoint file")
+            else:
+                input_path, out_dir_s = prepared
+                groups.setdefault(out_dir_s, []).append((input_file, input_path))
+
+        for out_dir_s, group in groups.items():
+            converted = converter._convert_chunk([input_path for _, input_path in group], out_dir_s, False, 'worker')
+            for input_file, input_path in group:
+                results[input_file] = (input_file, converted[input_path], None)
+
+        return [results[input_file] for input_file in input_files]
+    except Exception as e:
+        return [(input_file, False, str(e)) for input_file in input_files]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Bulk convert PPTX files to PDF using LibreOffice',
@@ -290,6 +1395,21 @@ Examples:
   # Convert multiple files with custom output directory
   python convert_pptx_to_pdf.py file1.pptx file2.pptx -o ./output/ --quality screen
 
+  # Convert a folder using 4 parallel LibreOffice workers
+  python convert_pptx_to_pdf.py /path/to/presentations/ --jobs 4
+
+  # Re-run on a folder, converting only new or changed presentations
+  python convert_pptx_to_pdf.py /path/to/presentations/ --incremental
+
+  # Write decks that are only full-slide pictures directly with Pillow
+  python convert_pptx_to_pdf.py /path/to/presentations/ --fast-image-mode
+
+  # Hand LibreOffice 32 files per run to spread its startup cost further
+  python convert_pptx_to_pdf.py /path/to/presentations/ --chunk-size 32
+
+  # Keep LibreOffice running between files (needs LibreOffice's Python-UNO bridge)
+  python convert_pptx_to_pdf.py /path/to/presentations/ --server --quality screen
+
   # Convert with custom LibreOffice path
   python convert_pptx_to_pdf.py presentation.pptx --libreoffice "C:/Program Files/LibreOffice/program/soffice.exe"
         """
@@ -305,14 +1425,40 @@ Examples:
     parser.add_argument('--engine', choices=['auto', 'powerpoint', 'libreoffice'],
                         default='auto',
                         help='Conversion engine: auto (prefer PowerPoint), powerpoint (Windows only), libreoffice (cross-platform)')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='Number of files to convert in parallel (default: number of CPU cores; PowerPoint always uses 1)')
+
+    parser.add_argument('--pipeline-depth', type=int, default=2, metavar='N',
+                        help='With --jobs 1, start the next LibreOffice process while up to N are still running (default: 2; 1 = strictly one at a time)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip files whose PDF already exists and is newer than the presentation')
+    parser.add_argument('--fast-image-mode', action='store_true',
+                        help='Convert decks whose slides are single full-slide pictures directly with Pillow, skipping LibreOffice/PowerPoint')
+    parser.add_argument('--chunk-size', type=int, default=16, metavar='N',
+                        help='Maximum number of files converted by each LibreOffice run (default: 16; 1 = one run per file)')
+    parser.add_argument('--server', action='store_true',
+                        help='Keep one LibreOffice instance running and convert over the UNO bridge (applies quality presets; requires python-uno)')
+    parser.add_argument('--restart-every', type=int, default=50, metavar='N',
+                        help='Restart the LibreOffice server after N files to contain memory leaks (default: 50)')
 
     args = parser.parse_args()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.pipeline_depth < 1:
+        parser.error('--pipeline-depth must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.restart_every < 0:
+        parser.error('--restart-every must not be negative')
+
     # Determine engine preference
     use_powerpoint = None if args.engine == 'auto' else (args.engine == 'powerpoint')
 
     # Initialize converter with quality setting
-    converter = PPTXtoPDFConverter(args.libreoffice, args.quality, use_powerpoint=use_powerpoint)
+    converter = PPTXtoPDFConverter(args.libreoffice, args.quality, use_powerpoint=use_powerpoint,
+                                   use_server=args.server, restart_every=args.restart_every,
+                                   fast_image_mode=args.fast_image_mode)
 
     # Check if conversion engine is available
     if converter.use_powerpoint:
@@ -333,11 +1479,16 @@ Examples:
         print(f"Using conversion engine: LibreOffice ({converter.libreoffice_path})")
 
     # Convert files
-    results = converter.convert_batch(
-        args.inputs,
-        args.output,
-        verbose=not args.quiet
-    )
+    with converter:
+        results = converter.convert_batch(
+            args.inputs,
+            args.output,
+            verbose=not args.quiet,
+            jobs=args.jobs,
+            pipeline_depth=args.pipeline_depth,
+            chunk_size=args.chunk_size,
+            incremental=args.incremental
+        )
 
     # Exit with error code if any failed
     sys.exit(0 if results['failed'] == 0 else 1)
@@ -7,10 +7,154 @@ Simple and intuitive interface for bulk PowerPoint to PDF conversion
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import time
+import json
+import multiprocessing
+import os
 import queue
+import shutil
+import sqlite3
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, Tuple
 import sys
-from convert_pptx_to_pdf import PPTXtoPDFConverter
+from convert_pptx_to_pdf import PPTXtoPDFConverter, convert_files_worker, init_profile_worker, is_up_to_date, iter_pptx, parent_dir, PPTX_SUFFIXES
+from conversion_cache import ConversionCache, fingerprint, place_pdf
+
+# Options remembered between sessions
+SETTINGS_FILE = Path.home() / '.config' / 'pptx2pdf' / 'gui_settings.json'
+
+# Oldest log lines are dropped beyond this, so inserts stay fast on huge batches
+MAX_LOG_LINES = 5000
+
+# Log line and tag for each outcome reported through post_file_done
+FILE_DONE_LINES = {
+    'ok': ("✓ Success: {name}", 'success'),
+    'fail': ("✗ Failed: {name}", 'error'),
+    'err': ("✗ Error: {name} - {error}", 'error'),
+    'reused': ("✓ Reused cached PDF: {name}", 'success'),
+    'skipped': ("Skipped (up to date): {name}", 'normal'),
+}
+
+
+def _pdf_path(input_file, output_dir) -> str:
+    """Where the PDF for input_file goes (next to it unless output_dir is set)"""
+    input_file = os.fspath(input_file)
+    stem = os.path.splitext(os.path.basename(input_file))[0]
+    return os.path.join(output_dir or os.path.dirname(input_file), stem + '.pdf')
+
+
+def _scan_pptx(root) -> Iterator[Tuple[Path, os.stat_result]]:
+    """
+    Yield (path, os.stat_result) for the PowerPoint files under root (any
+    letter case) as a single walk finds them
+
+    The stat comes from the directory entry (free on Windows, one call on
+    Linux) and is reused for the up-to-date check and the cache fingerprint.
+    """
+    for entry in iter_pptx(root):
+        yield Path(entry.path), entry.stat(follow_symlinks=False)
+
+
+def _iter_input_files(input_paths) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Yield (path, os.stat_result) for the PowerPoint files among input_paths, walking folders only as they are reached"""
+    for path in input_paths:
+        if os.path.splitext(path)[1].lower() in PPTX_SUFFIXES and os.path.isfile(path):
+            yield Path(path), os.stat(path)
+        elif os.path.isdir(path):
+            yield from _scan_pptx(path)
+
+
+def _has_pptx(input_paths) -> bool:
+    """Check for at least one PowerPoint file among input_paths, stopping at the first"""
+    return next(_iter_input_files(input_paths), None) is not None
+
+
+def _stream_chunks(files, output_dir, jobs: int):
+    """
+    Group a stream of files into chunks for one soffice run each
+
+    The total isn't known while the scan is running, so chunks start at one
+    file and grow to 8 as more files turn up: the first workers start right
+    away and small batches still spread over every core. A run has a single
+    --outdir, so a chunk never spans two output folders (the scan yields a
+    folder's files together).
+
+    Yields:
+        (files, out_dir_s) tuples
+    """
+    chunk = []
+    chunk_dir = None
+    seen = 0
+    for file_path in files:
+        seen += 1
+        file_dir = output_dir or parent_dir(file_path)
+        if chunk and file_dir != chunk_dir:
+            yield chunk, chunk_dir
+            chunk = []
+        chunk_dir = file_dir
+        chunk.append(file_path)
+        if len(chunk) >= max(1, min(8, seen // jobs)):
+            yield chunk, chunk_dir
+            chunk = []
+    if chunk:
+        yield chunk, chunk_dir
+
+
+class _ScanProgress:
+    """
+    Runs a lazy scan on its own thread, ahead of the conversions, and counts
+    the files it finds, so progress is reported against an estimated total
+    that settles as soon as the scan is finished
+
+    Iterating yields the scanned items in order, waiting for the scan where
+    it hasn't got that far yet; an error in the scan is raised there.
+    """
+
+    _END = object()
+
+    def __init__(self, files):
+        self._files = files
+        self._queue = queue.Queue()
+        self._stopped = False
+        self._error = None
+        self.found = 0
+        self.done = 0
+        self.finished = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Abandon the scan (the conversion ended early)"""
+        self._stopped = True
+
+    def _run(self):
+        try:
+            for item in self._files:
+                if self._stopped:
+                    return
+                self.found += 1
+                self._queue.put(item)
+        except Exception as e:
+            self._error = e
+        finally:
+            self.finished = True
+            self._queue.put(self._END)
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
 
 
 class ConverterGUI:
@@ -23,21 +167,32 @@ class ConverterGUI:
         # Initialize converter
         self.converter = PPTXtoPDFConverter()
 
-        # Queue for thread-safe GUI updates
-        self.message_queue = queue.Queue()
+        # Updates posted by the conversion thread, applied on the Tk thread by
+        # a single scheduled flush (see _schedule_flush)
+        self._pending_logs = deque()
+        self._pending_progress = None
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        # When the last flush ran; flushes are at least 50 ms apart (see _schedule_flush)
+        self._last_flush = 0.0
 
         # Track conversion state
         self.is_converting = False
 
+        # Log autoscroll is throttled (see log_message)
+        self._last_scroll = 0.0
+        self._scroll_pending = False
+
+        # Saved options
+        self.settings = self.load_settings()
+
         # Setup UI
         self.setup_ui()
 
         # Check conversion engines on startup
         self.check_engines()
 
-        # Start queue processor
-        self.process_queue()
-
     def setup_ui(self):
         """Create the user interface"""
 
@@ -178,6 +333,16 @@ class ConverterGUI:
         )
         btn_reset_output.grid(row=2, column=3, padx=(5, 0))
 
+        # Incremental mode (row 3)
+        self.skip_up_to_date_var = tk.BooleanVar(value=self.settings.get('skip_up_to_date', False))
+        skip_check = ttk.Checkbutton(
+            output_frame,
+            text="Skip if PDF exists and is up to date",
+            variable=self.skip_up_to_date_var,
+            command=self.on_skip_up_to_date_change
+        )
+        skip_check.grid(row=3, column=0, columnspan=4, sticky=tk.W, pady=(10, 0))
+
         # Progress section
         progress_frame = ttk.LabelFrame(main_frame, text="Conversion Progress", padding="10")
         progress_frame.grid(row=4, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
@@ -204,6 +369,11 @@ class ConverterGUI:
         self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         progress_frame.rowconfigure(1, weight=1)
 
+        # Log colors, applied to text as it is inserted
+        self.status_text.tag_config('normal')
+        self.status_text.tag_config('error', foreground='red')
+        self.status_text.tag_config('success', foreground='green')
+
         # Bottom frame with action buttons
         bottom_frame = ttk.Frame(main_frame)
         bottom_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -252,17 +422,28 @@ class ConverterGUI:
             self.log_message("Or for PowerPoint COM (Windows): pip install pywin32\n", 'error')
 
     def log_message(self, message, tag='normal'):
-        """Add message to status text area"""
-        self.status_text.insert(tk.END, message)
-        if tag == 'error':
-            # Get the last line and apply red color
-            self.status_text.tag_add('error', 'end-2l', 'end-1l')
-            self.status_text.tag_config('error', foreground='red')
-        elif tag == 'success':
-            self.status_text.tag_add('success', 'end-2l', 'end-1l')
-            self.status_text.tag_config('success', foreground='green')
+        """Add message (one or more lines) to status text area"""
+        self.status_text.insert(tk.END, message, (tag,))
+
+        line_count = int(self.status_text.index('end-1c').split('.')[0])
+        if line_count > MAX_LOG_LINES:
+            self.status_text.delete('1.0', f'{line_count - MAX_LOG_LINES + 1}.0')
+
+        # Scrolling forces a layout pass: do it at most every 100 ms, with a
+        # trailing scroll so the last lines always end up in view
+        now = time.monotonic()
+        if now - self._last_scroll >= 0.1:
+            self._last_scroll = now
+            self.status_text.see(tk.END)
+        elif not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after(100, self._scroll_to_end)
+
+    def _scroll_to_end(self):
+        """Deferred autoscroll scheduled by log_message"""
+        self._scroll_pending = False
+        self._last_scroll = time.monotonic()
         self.status_text.see(tk.END)
-        self.root.update_idletasks()
 
     def clear_log(self):
         """Clear the status text area"""
@@ -296,6 +477,29 @@ class ConverterGUI:
 
         self.log_message(f"Quality changed to: {selected.upper()} - {description}\n")
 
+    def on_skip_up_to_date_change(self):
+        """Handle the skip-up-to-date checkbox"""
+        self.settings['skip_up_to_date'] = self.skip_up_to_date_var.get()
+        self.save_settings()
+
+    def load_settings(self):
+        """Load saved options, or defaults if there are none"""
+        try:
+            with open(SETTINGS_FILE, encoding='utf-8') as f:
+                settings = json.load(f)
+            return settings if isinstance(settings, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save_settings(self):
+        """Save options for the next session"""
+        try:
+            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.settings, f, indent=2)
+        except OSError as e:
+            self.log_message(f"Could not save settings: {e}\n", 'error')
+
     def get_output_directory(self):
         """Get the output directory or None if using default"""
         output = self.output_dir_var.get()
@@ -325,6 +529,10 @@ class ConverterGUI:
         )
 
         if file_path:
+            if not _has_pptx([file_path]):
+                messagebox.showwarning("No Files", f"Not a PPTX file:\n{file_path}")
+                return
+
             self.clear_log()
             self.log_message(f"Selected: {file_path}\n")
             self.log_message("=" * 60 + "\n")
@@ -361,6 +569,10 @@ class ConverterGUI:
         )
 
         if file_paths:
+            if not _has_pptx(file_paths):
+                messagebox.showwarning("No Files", "None of the selected files is a PPTX file.")
+                return
+
             self.clear_log()
             self.log_message(f"Selected {len(file_paths)} file(s)\n")
             self.log_message("=" * 60 + "\n")
@@ -391,21 +603,18 @@ class ConverterGUI:
         folder_path = filedialog.askdirectory(title="Select Folder Containing PPTX Files")
 
         if folder_path:
-            # Count PPTX files in folder
-            folder = Path(folder_path)
-            pptx_files = list(folder.rglob('*.pptx')) + list(folder.rglob('*.ppt'))
-            pptx_files += list(folder.rglob('*.PPTX')) + list(folder.rglob('*.PPT'))
-
-            if not pptx_files:
+            # The walk stops at the first presentation; the full scan runs in
+            # the conversion thread
+            if not _has_pptx([folder_path]):
                 messagebox.showwarning("No Files", f"No PPTX files found in:\n{folder_path}")
                 return
 
             self.clear_log()
             self.log_message(f"Selected folder: {folder_path}\n")
-            self.log_message(f"Found {len(pptx_files)} PPTX file(s)\n")
             self.log_message("=" * 60 + "\n")
 
-            # Run conversion in separate thread
+            # Run conversion in separate thread; the folder is scanned there,
+            # while the first files are already converting
             thread = threading.Thread(
                 target=self.run_conversion,
                 args=([folder_path],),
@@ -425,102 +634,351 @@ class ConverterGUI:
         # Preserve libreoffice_path if it exists
         libreoffice_path = getattr(self.converter, 'libreoffice_path', None)
         self.converter = PPTXtoPDFConverter(libreoffice_path, quality)
+        cache = None
+        scan = None
 
         try:
-            # Collect all files
-            files_to_convert = []
-            for path in input_paths:
-                p = Path(path)
-                if p.is_file() and p.suffix.lower() in ['.pptx', '.ppt']:
-                    files_to_convert.append(p)
-                elif p.is_dir():
-                    files_to_convert.extend(p.rglob('*.pptx'))
-                    files_to_convert.extend(p.rglob('*.ppt'))
-                    files_to_convert.extend(p.rglob('*.PPTX'))
-                    files_to_convert.extend(p.rglob('*.PPT'))
-
-            if not files_to_convert:
-                self.message_queue.put(('log', "No PPTX files to convert.\n", 'error'))
+            # Files are found while earlier ones convert; until the scan is
+            # done the total is an estimate and the progress bar just pulses
+            scan = _ScanProgress(_iter_input_files(input_paths)).start()
+            self._post(self.start_indeterminate_progress)
+
+            skip_up_to_date = self.skip_up_to_date_var.get()
+            skipped_count = 0
+            reused_count = 0
+            fingerprints = {}
+            cache = self.open_cache()
+
+            def files_to_convert():
+                nonlocal skipped_count, reused_count
+                for file_path, file_stat in scan:
+                    # Leave out files whose PDF is already newer than the presentation
+                    if skip_up_to_date and is_up_to_date(file_stat, _pdf_path(file_path, output_dir)):
+                        skipped_count += 1
+                        self.post_file_done(scan, file_path.name, 'skipped')
+                        continue
+
+                    # Copy PDFs already produced for identical presentations
+                    if cache:
+                        reused, key = self.reuse_cached_pdf(cache, file_path, file_stat.st_size, output_dir, quality)
+                        if reused:
+                            reused_count += 1
+                            self.post_file_done(scan, file_path.name, 'reused')
+                            continue
+                        if key:
+                            fingerprints[file_path] = key
+
+                    yield file_path
+
+            self.post_log("\nStarting conversion...\n\n", 'normal')
+
+            if self.converter.use_powerpoint:
+                converted_count, failed_count, converted = self.convert_with_powerpoint(files_to_convert(), output_dir, scan)
+            else:
+                # Selected files (no folders): no point starting more workers than files
+                max_jobs = len(input_paths) if all(os.path.isfile(path) for path in input_paths) else None
+                converted_count, failed_count, converted = self.convert_in_parallel(
+                    files_to_convert(), output_dir, quality, scan, max_jobs)
+            self.post_progress(100)
+
+            if cache:
+                cache.store(
+                    (fingerprints[file_path], _pdf_path(file_path, output_dir))
+                    for file_path in converted if file_path in fingerprints
+                )
+
+            # Files can vanish between the check before the thread and the scan
+            if scan.found == 0:
+                self.post_log("No PPTX files to convert.\n", 'error')
+                self.post_message_box('warning', 'No Files', 'No PPTX files found to convert.')
                 return
 
-            total_files = len(files_to_convert)
-            success_count = 0
-            failed_count = 0
-
-            self.message_queue.put(('log', f"\nStarting conversion of {total_files} file(s)...\n\n", 'normal'))
-
-            for i, file_path in enumerate(files_to_convert, 1):
-                # Update progress
-                progress = (i - 1) / total_files * 100
-                self.message_queue.put(('progress', progress))
-
-                file_size = file_path.stat().st_size / (1024 * 1024)  # MB
-                self.message_queue.put(('log', f"[{i}/{total_files}] Converting: {file_path.name} ({file_size:.2f} MB)\n", 'normal'))
-
-                # Convert file
-                try:
-                    result = self.converter.convert_file(str(file_path), output_dir, verbose=False)
-
-                    if result:
-                        success_count += 1
-                        self.message_queue.put(('log', f"✓ Success: {file_path.name}\n", 'success'))
-                    else:
-                        failed_count += 1
-                        self.message_queue.put(('log', f"✗ Failed: {file_path.name}\n", 'error'))
-                except Exception as e:
-                    failed_count += 1
-                    self.message_queue.put(('log', f"✗ Error: {file_path.name} - {str(e)}\n", 'error'))
+            if skipped_count == scan.found:
+                self.post_log(f"\nAll {skipped_count} PDF(s) are up to date.\n", 'success')
+                self.post_message_box('success', 'Conversion Complete', 'All PDFs are up to date!')
+                return
 
-                # Update progress
-                progress = i / total_files * 100
-                self.message_queue.put(('progress', progress))
+            total_files = scan.found - skipped_count
+            success_count = reused_count + converted_count
 
             # Final summary
-            self.message_queue.put(('log', "\n" + "=" * 60 + "\n", 'normal'))
-            self.message_queue.put(('log', "Conversion Summary:\n", 'normal'))
-            self.message_queue.put(('log', f"  Total files: {total_files}\n", 'normal'))
-            self.message_queue.put(('log', f"  Successful: {success_count}\n", 'success'))
+            self.post_log("\n" + "=" * 60 + "\n", 'normal')
+            self.post_log("Conversion Summary:\n", 'normal')
+            self.post_log(f"  Total files: {total_files}\n", 'normal')
+            self.post_log(f"  Successful: {success_count}\n", 'success')
             if failed_count > 0:
-                self.message_queue.put(('log', f"  Failed: {failed_count}\n", 'error'))
-            self.message_queue.put(('log', "\nConversion complete!\n", 'success'))
+                self.post_log(f"  Failed: {failed_count}\n", 'error')
+            if reused_count > 0:
+                self.post_log(f"  Reused from cache: {reused_count}\n", 'normal')
+            if skipped_count > 0:
+                self.post_log(f"  Skipped (up to date): {skipped_count}\n", 'normal')
+            self.post_log("\nConversion complete!\n", 'success')
 
             # Show completion message
             if failed_count == 0:
-                self.message_queue.put(('msgbox', ('success', 'Conversion Complete', f'Successfully converted {success_count} file(s)!')))
+                self.post_message_box('success', 'Conversion Complete', f'Successfully converted {success_count} file(s)!')
             else:
-                self.message_queue.put(('msgbox', ('warning', 'Conversion Complete', f'Converted {success_count} file(s)\n{failed_count} file(s) failed')))
+                self.post_message_box('warning', 'Conversion Complete', f'Converted {success_count} file(s)\n{failed_count} file(s) failed')
 
         except Exception as e:
-            self.message_queue.put(('log', f"\nError during conversion: {str(e)}\n", 'error'))
-            self.message_queue.put(('msgbox', ('error', 'Conversion Error', str(e))))
+            self.post_log(f"\nError during conversion: {str(e)}\n", 'error')
+            self._post(self.stop_indeterminate_progress)
+            self.post_message_box('error', 'Conversion Error', str(e))
 
         finally:
+            if scan is not None:
+                scan.stop()
+            if cache:
+                cache.close()
             self.is_converting = False
 
-    def process_queue(self):
-        """Process messages from the conversion thread"""
+    def open_cache(self):
+        """Open the conversion cache, or return None if it can't be used"""
+        try:
+            return ConversionCache()
+        except (OSError, sqlite3.Error) as e:
+            self.post_log(f"Conversion cache unavailable: {e}\n", 'normal')
+            return None
+
+    def reuse_cached_pdf(self, cache, file_path, size, output_dir, quality):
+        """
+        Copy the PDF the cache holds for an identical presentation
+
+        Returns:
+            (reused, fingerprint) tuple; the fingerprint is None if the file
+            couldn't be read
+        """
+        try:
+            key = fingerprint(file_path, quality, self.converter.engine, size)
+        except OSError:
+            return False, None  # The converter reports unreadable files
+
+        cached_pdf = cache.lookup(key)
+        if cached_pdf:
+            pdf_path = _pdf_path(file_path, output_dir)
+            try:
+                # The file's own earlier PDF: converting again is the point
+                # (keeping it is what "Skip if PDF exists" is for)
+                if os.path.exists(pdf_path) and os.path.samefile(cached_pdf, pdf_path):
+                    return False, key
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+                place_pdf(cached_pdf, pdf_path)
+                return True, key
+            except OSError:
+                pass
+        return False, key
+
+    def convert_with_powerpoint(self, files_to_convert, output_dir, scan):
+        """
+        Convert files one at a time with a single PowerPoint instance
+        (COM automation drives one application, so there is no pool here)
+
+        Returns:
+            (success_count, failed_count, converted files) tuple
+        """
+        success_count = 0
+        failed_count = 0
+        converted = []
+
+        def on_result(input_file, result, error):
+            nonlocal success_count, failed_count
+            if result:
+                success_count += 1
+                converted.append(Path(input_file))
+            else:
+                failed_count += 1
+            self.post_file_done(scan, Path(input_file).name, 'ok' if result else 'err' if error else 'fail', error)
+
+        self.converter.powerpoint_converter.convert_many(
+            (str(file_path) for file_path in files_to_convert),
+            output_dir,
+            verbose=False,
+            callback=on_result
+        )
+        return success_count, failed_count, converted
+
+    def convert_in_parallel(self, files_to_convert, output_dir, quality, scan, max_jobs=None):
+        """
+        Convert files with LibreOffice in a pool of worker processes, one
+        soffice per core, each with its own LibreOffice profile (kept in
+        ~/.cache/pptx2pdf/profiles between runs, so only the first run pays
+        for creating them)
+
+        Each task hands a small group of files to a single soffice run, so
+        LibreOffice's startup cost is paid once per group. Groups are
+        submitted as the scan produces them, keeping at most two per worker
+        in flight.
+
+        Args:
+            max_jobs: Upper bound on worker processes (e.g. the number of
+                selected files), if known
+
+        Returns:
+            (success_count, failed_count, converted files) tuple
+        """
+        jobs = os.cpu_count() or 1
+        if sys.platform == 'win32':
+            jobs = min(jobs, 61)  # ProcessPoolExecutor's limit on Windows
+        if max_jobs:
+            jobs = min(jobs, max_jobs)
+        max_inflight = 2 * jobs
+        chunks = _stream_chunks(files_to_convert, output_dir, jobs)
+
+        libreoffice_path = str(self.converter.libreoffice_path)
+        success_count = 0
+        failed_count = 0
+        converted = []
+
+        if jobs > 1:
+            self.post_log(f"Running up to {jobs} conversions in parallel\n\n", 'normal')
+
+        # Worker n takes profile n; workers live for the whole batch, so no
+        # two soffice processes share a profile
+        # Workers are spawned rather than forked from this multithreaded Tk process
+        mp_context = multiprocessing.get_context('spawn')
+        profile_slots = mp_context.Queue()
+        for slot in range(jobs):
+            profile_slots.put(slot)
+
+        work_dir = tempfile.mkdtemp(prefix='pptx2pdf_gui_')
         try:
-            while True:
-                msg_type, *args = self.message_queue.get_nowait()
-
-                if msg_type == 'log':
-                    self.log_message(args[0], args[1] if len(args) > 1 else 'normal')
-                elif msg_type == 'progress':
-                    self.progress_var.set(args[0])
-                elif msg_type == 'msgbox':
-                    box_type, title, message = args[0]
-                    if box_type == 'success':
-                        messagebox.showinfo(title, message)
-                    elif box_type == 'warning':
-                        messagebox.showwarning(title, message)
-                    elif box_type == 'error':
-                        messagebox.showerror(title, message)
-
-        except queue.Empty:
-            pass
-
-        # Schedule next check
-        self.root.after(100, self.process_queue)
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context,
+                                     initializer=init_profile_worker, initargs=(profile_slots,)) as executor:
+                futures = {}
+                while True:
+                    for chunk, _ in islice(chunks, max_inflight - len(futures)):
+                        future = executor.submit(convert_files_worker, [str(file_path) for file_path in chunk],
+                                                 output_dir, quality, libreoffice_path, work_dir)
+                        futures[future] = chunk
+                    if not futures:
+                        break
+
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        chunk = futures.pop(future)
+                        try:
+                            results = [(file_path, result, error)
+                                       for file_path, (_, result, error) in zip(chunk, future.result())]
+                        except Exception as e:
+                            results = [(file_path, False, str(e)) for file_path in chunk]
+
+                        for file_path, result, error in results:
+                            if result:
+                                success_count += 1
+                                converted.append(file_path)
+                            else:
+                                failed_count += 1
+                            self.post_file_done(scan, file_path.name, 'ok' if result else 'err' if error else 'fail', error)
+        finally:
+            # Workers have exited once the pool is shut down, so their staging
+            # folders are unused
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return success_count, failed_count, converted
+
+    def start_indeterminate_progress(self):
+        """Pulse the progress bar until the first percentage is known"""
+        self.progress_bar.config(mode='indeterminate')
+        self.progress_bar.start(10)
+
+    def stop_indeterminate_progress(self):
+        """Stop pulsing the progress bar, if it is"""
+        if str(self.progress_bar['mode']) == 'indeterminate':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate')
+
+    def _post(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from the conversion thread"""
+        self.root.after(0, fn, *args)
+
+    def _schedule_flush(self):
+        """
+        Make sure one flush of the pending updates is scheduled, no sooner
+        than 50 ms after the previous one
+
+        Updates are only ever deferred, never dropped, so the last one of a
+        batch always reaches the window.
+        """
+        with self._pending_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        delay = max(0.0, self._last_flush + 0.05 - time.monotonic())
+        # Outside the lock: after() from this thread waits for the Tk thread,
+        # which may be inside _flush_pending
+        self.root.after(int(delay * 1000), self._flush_pending)
+
+    def post_log(self, message, tag='normal'):
+        """Add message to the log from the conversion thread"""
+        with self._pending_lock:
+            self._pending_logs.append((message, tag))
+        self._schedule_flush()
+
+    def post_progress(self, progress):
+        """Update the progress bar from the conversion thread"""
+        with self._pending_lock:
+            self._pending_progress = progress
+        self._schedule_flush()
+
+    def post_file_done(self, scan, name, status, error=None):
+        """
+        Count one more file as handled, posting its log line and the new
+        progress in a single update
+
+        Args:
+            scan: _ScanProgress of the running batch
+            name: File name
+            status: Key of FILE_DONE_LINES
+            error: Error message for the 'err' status
+        """
+        scan.done += 1
+        line, tag = FILE_DONE_LINES[status]
+        message = f"[{scan.done}/{scan.found}] " + line.format(name=name, error=error) + "\n"
+        with self._pending_lock:
+            self._pending_logs.append((message, tag))
+            # Until the scan is done the total is a guess; the bar keeps pulsing
+            if scan.finished:
+                self._pending_progress = scan.done / scan.found * 100
+        self._schedule_flush()
+
+    def post_message_box(self, box_type, title, message):
+        """Show a message box from the conversion thread"""
+        self._post(self.show_message_box, box_type, title, message)
+
+    def _flush_pending(self):
+        """Apply every update posted since the last flush"""
+        with self._pending_lock:
+            logs, self._pending_logs = self._pending_logs, deque()
+            progress, self._pending_progress = self._pending_progress, None
+            self._flush_scheduled = False
+            self._last_flush = time.monotonic()
+
+        # Consecutive log messages with the same tag go in as one insert
+        run_tag = None
+        run = []
+        for message, tag in logs:
+            if tag != run_tag and run:
+                self.log_message(''.join(run), run_tag)
+                run = []
+            run_tag = tag
+            run.append(message)
+        if run:
+            self.log_message(''.join(run), run_tag)
+
+        if progress is not None:
+            self.stop_indeterminate_progress()
+            self.progress_var.set(progress)
+
+    def show_message_box(self, box_type, title, message):
+        """Show a message box once the log is up to date"""
+        self._flush_pending()
+        if box_type == 'success':
+            messagebox.showinfo(title, message)
+        elif box_type == 'warning':
+            messagebox.showwarning(title, message)
+        elif box_type == 'error':
+            messagebox.showerror(title, message)
 
 
 def main():
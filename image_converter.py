@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Image-Only Fast Path for PDF Conversion
+Converts decks made of full-slide pictures straight to PDF with Pillow,
+without starting LibreOffice or PowerPoint
+"""
+
+import io
+import os
+import posixpath
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# OOXML namespaces used by slide XML
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+EMU_PER_INCH = 914400
+
+# Raster formats Pillow can decode; vector media (EMF/WMF/SVG) needs a real renderer
+RASTER_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff'})
+
+# Pillow keeps every page in memory while writing the PDF, so large decks at
+# high DPI go through the regular engine instead
+MAX_TOTAL_PIXELS = 500 * 1000 * 1000
+
+
+def is_pillow_available():
+    """Check if Pillow is installed"""
+    try:
+        import PIL.Image
+        return True
+    except ImportError:
+        return False
+
+
+def _tag(prefix, name):
+    """Qualified ElementTree tag for a namespace prefix"""
+    return f"{{{NS[prefix]}}}{name}"
+
+
+def _read_rels(archive, part_name):
+    """Map relationship ids of an OOXML part to target part names"""
+    directory, filename = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, '_rels', filename + '.rels')
+    try:
+        root = ET.fromstring(archive.read(rels_name))
+    except KeyError:
+        return {}
+
+    rels = {}
+    for rel in root.findall('rel:Relationship', NS):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        if target.startswith('/'):
+            rels[rel.get('Id')] = target.lstrip('/')
+        else:
+            rels[rel.get('Id')] = posixpath.normpath(posixpath.join(directory, target))
+    return rels
+
+
+class ImageOnlyConverter:
+    """
+    Fast PDF conversion for presentations whose slides are single full-slide pictures
+    Anything else (text, shapes, charts, cropped or transformed pictures) is
+    left to the regular conversion engine
+    """
+
+    def __init__(self, dpi=150, jpeg_quality=85):
+        """
+        Initialize image-only converter
+
+        Args:
+            dpi: Output resolution of the slide images
+            jpeg_quality: JPEG quality used for the PDF pages
+        """
+        if not is_pillow_available():
+            raise ImportError("The image-only fast path requires the Pillow package")
+
+        self.dpi = dpi
+        self.jpeg_quality = jpeg_quality
+
+    def _slide_images(self, archive):
+        """
+        Find the picture behind every slide
+
+        Returns:
+            ((width_emu, height_emu), [media part names in slide order]),
+            or None if the deck needs a full renderer
+        """
+        presentation = ET.fromstring(archive.read('ppt/presentation.xml'))
+        size = presentation.find('p:sldSz', NS)
+        slide_list = presentation.find('p:sldIdLst', NS)
+        if size is None or slide_list is None:
+            return None
+        width, height = int(size.get('cx')), int(size.get('cy'))
+
+        presentation_rels = _read_rels(archive, 'ppt/presentation.xml')
+        media = []
+        for slide_id in slide_list.findall('p:sldId', NS):
+            slide_part = presentation_rels.get(slide_id.get(_tag('r', 'id')))
+            if slide_part is None:
+                return None
+            picture = self._slide_picture(archive, slide_part, width, height)
+            if picture is None:
+                return None
+            media.append(picture)
+
+        if not media:
+            return None
+        return (width, height), media
+
+    def _slide_picture(self, archive, slide_part, width, height):
+        """Return the media part of a slide's only picture, or None if the slide has more"""
+        slide = ET.fromstring(archive.read(slide_part))
+
+        # Hidden slides are left out of the PDF by the regular engines
+        if slide.get('show') == '0':
+            return None
+
+        shape_tree = slide.find('p:cSld/p:spTree', NS)
+        if shape_tree is None:
+            return None
+
+        picture = None
+        for shape in shape_tree:
+            if shape.tag in (_tag('p', 'nvGrpSpPr'), _tag('p', 'grpSpPr'), _tag('p', 'extLst')):
+                continue
+            if shape.tag == _tag('p', 'sp'):
+                # Empty placeholders are not drawn; anything with text or
+                # its own geometry is
+                is_placeholder = shape.find('p:nvSpPr/p:nvPr/p:ph', NS) is not None
+                has_text = any(t.text for t in shape.iter(_tag('a', 't')))
+                if is_placeholder and not has_text:
+                    continue
+                return None
+            if shape.tag == _tag('p', 'pic') and picture is None:
+                picture = shape
+                continue
+            return None
+
+        if picture is None:
+            return None
+
+        # Hidden pictures aren't drawn at all
+        properties = picture.find('p:nvPicPr/p:cNvPr', NS)
+        if properties is not None and properties.get('hidden') in ('1', 'true'):
+            return None
+
+        # The picture must fill the slide exactly, without crop, rotation or effects
+        blip_fill = picture.find('p:blipFill', NS)
+        shape_properties = picture.find('p:spPr', NS)
+        if blip_fill is None or shape_properties is None:
+            return None
+        xfrm = shape_properties.find('a:xfrm', NS)
+        if xfrm is None:
+            return None
+        for child in shape_properties:
+            # Outlines, effects, fills and non-rectangular clipping all change the output
+            if child.tag == _tag('a', 'prstGeom') and child.get('prst') == 'rect':
+                continue
+            if child.tag != _tag('a', 'xfrm'):
+                return None
+        if blip_fill.find('a:srcRect', NS) is not None:
+            return None
+        # Stretched to the frame, not tiled
+        if blip_fill.find('a:stretch', NS) is None or blip_fill.find('a:tile', NS) is not None:
+            return None
+        if xfrm.get('rot', '0') != '0' or xfrm.get('flipH') == '1' or xfrm.get('flipV') == '1':
+            return None
+        offset, extent = xfrm.find('a:off', NS), xfrm.find('a:ext', NS)
+        if offset is None or extent is None:
+            return None
+        if (int(offset.get('x')), int(offset.get('y'))) != (0, 0):
+            return None
+        if abs(int(extent.get('cx')) - width) > width // 100 or abs(int(extent.get('cy')) - height) > height // 100:
+            return None
+
+        blip = blip_fill.find('a:blip', NS)
+        if blip is None or blip.get(_tag('r', 'embed')) is None:
+            return None
+        if any(child.tag != _tag('a', 'extLst') for child in blip):
+            return None  # Colour or transparency effects
+
+        media_part = _read_rels(archive, slide_part).get(blip.get(_tag('r', 'embed')))
+        if media_part is None or posixpath.splitext(media_part)[1].lower() not in RASTER_SUFFIXES:
+            return None
+        return media_part
+
+    def try_convert(self, input_file: str, output_pdf: str):
+        """
+        Convert a presentation if every slide is a single full-slide picture
+
+        Args:
+            input_file: Path to PPTX file
+            output_pdf: Path of the PDF to write
+
+        Returns:
+            True if the PDF was written, False if the deck needs the regular engine
+        """
+        from PIL import Image
+
+        if Path(input_file).suffix.lower() != '.pptx':
+            return False
+
+        try:
+            with zipfile.ZipFile(input_file) as archive:
+                found = self._slide_images(archive)
+                if found is None:
+                    return False
+                (width, height), media = found
+
+                page_size = (
+                    max(1, round(width * self.dpi / EMU_PER_INCH)),
+                    max(1, round(height * self.dpi / EMU_PER_INCH))
+                )
+                if page_size[0] * page_size[1] * len(media) > MAX_TOTAL_PIXELS:
+                    return False
+
+                pages = []
+                for media_part in media:
+                    image = Image.open(io.BytesIO(archive.read(media_part)))
+                    # Transparent pixels show the layout or master background
+                    # underneath, which flattening to RGB would paint black
+                    if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+                        return False
+                    # Let the JPEG decoder downscale while decoding where it can
+                    image.draft('RGB', page_size)
+                    if image.mode != 'RGB':
+                        image = image.convert('RGB')
+                    if image.size != page_size:
+                        image = image.resize(page_size, Image.LANCZOS, reducing_gap=3.0)
+                    pages.append(image)
+        except (zipfile.BadZipFile, KeyError, ValueError, ET.ParseError, OSError):
+            return False
+
+        try:
+            pages[0].save(
+                output_pdf,
+                'PDF',
+                save_all=True,
+                append_images=pages[1:],
+                resolution=self.dpi,
+                quality=self.jpeg_quality
+            )
+        except Exception:
+            try:
+                os.remove(output_pdf)
+            except OSError:
+                pass
+            raise
+        return True
+
+
+if __name__ == '__main__':
+    # Report whether each given deck qualifies for the image-only fast path
+    if not is_pillow_available():
+        print("ERROR: Pillow is not installed")
+        print("  Install: pip install Pillow")
+        sys.exit(1)
+
+    converter = ImageOnlyConverter()
+    for path in sys.argv[1:]:
+        try:
+            with zipfile.ZipFile(path) as archive:
+                eligible = converter._slide_images(archive) is not None
+        except (zipfile.BadZipFile, KeyError, ValueError, ET.ParseError, OSError):
+            eligible = False
+        print(f"{'OK' if eligible else 'NO'}: {path}")
@@ -7,19 +7,22 @@ Windows-only module
 
 import os
 import sys
-from pathlib import Path
+
+# pywin32 provides COM automation (Windows only)
+try:
+    import pythoncom
+    import win32com.client
+    PYWIN32_AVAILABLE = sys.platform == 'win32'
+except ImportError:
+    PYWIN32_AVAILABLE = False
+
+# File extensions PowerPoint is asked to open (compared lower-cased)
+_PPTX_SUFFIXES = frozenset({'.pptx', '.ppt'})
 
 
 def is_powerpoint_available():
     """Check if PowerPoint is available via COM"""
-    if sys.platform != 'win32':
-        return False
-
-    try:
-        import win32com.client
-        return True
-    except ImportError:
-        return False
+    return PYWIN32_AVAILABLE
 
 
 def check_powerpoint_installation():
@@ -28,7 +31,6 @@ def check_powerpoint_installation():
         return False
 
     try:
-        import win32com.client
         powerpoint = win32com.client.Dispatch("PowerPoint.Application")
         powerpoint.Quit()
         return True
@@ -43,25 +45,39 @@ class PowerPointConverter:
     """
 
     # PowerPoint PDF export quality constants
+    # PDF/A, structure tags and bitmapped fonts cost export time, so only the
+    # print presets ask for them
     QUALITY_SETTINGS = {
         'screen': {
             'name': 'Screen/Web (PowerPoint Standard)',
             'ppFixedFormatIntent': 1,  # ppFixedFormatIntentScreen
+            'pdfa': False,  # UseISO19005_1
+            'tags': False,  # DocStructureTags
+            'bitmap_missing': False,  # BitmapMissingFonts
             'description': 'Optimized for screen viewing, smallest files'
         },
         'standard': {
             'name': 'Standard Quality',
             'ppFixedFormatIntent': 1,  # ppFixedFormatIntentScreen
+            'pdfa': False,  # UseISO19005_1
+            'tags': False,  # DocStructureTags
+            'bitmap_missing': False,  # BitmapMissingFonts
             'description': 'Balanced quality for most uses'
         },
         'high': {
             'name': 'Print Quality',
             'ppFixedFormatIntent': 2,  # ppFixedFormatIntentPrint
+            'pdfa': True,  # UseISO19005_1
+            'tags': True,  # DocStructureTags
+            'bitmap_missing': True,  # BitmapMissingFonts
             'description': 'High quality for printing'
         },
         'maximum': {
             'name': 'Maximum Quality',
             'ppFixedFormatIntent': 2,  # ppFixedFormatIntentPrint
+            'pdfa': True,  # UseISO19005_1
+            'tags': True,  # DocStructureTags
+            'bitmap_missing': True,  # BitmapMissingFonts
             'description': 'Highest quality, larger files'
         }
     }
@@ -78,14 +94,20 @@ class PowerPointConverter:
 
         self.quality = quality if quality in self.QUALITY_SETTINGS else 'screen'
         self.powerpoint = None
+        self._open = None
 
     def _start_powerpoint(self):
         """Start PowerPoint application"""
         if self.powerpoint is None:
-            import win32com.client
             self.powerpoint = win32com.client.Dispatch("PowerPoint.Application")
             # Don't show PowerPoint window
             self.powerpoint.Visible = 0
+            # No alert or macro-security dialogs: an unattended batch would
+            # wait on them forever
+            self.powerpoint.DisplayAlerts = 1  # ppAlertsNone
+            self.powerpoint.AutomationSecurity = 3  # msoAutomationSecurityForceDisable
+            # Resolve Presentations.Open once instead of per file
+            self._open = self.powerpoint.Presentations.Open
 
     def _quit_powerpoint(self):
         """Quit PowerPoint application"""
@@ -95,6 +117,7 @@ class PowerPointConverter:
             except:
                 pass
             self.powerpoint = None
+            self._open = None
 
     def convert_file(self, input_file: str, output_dir: str = None, verbose: bool = True):
         """
@@ -108,30 +131,35 @@ class PowerPointConverter:
         Returns:
             True if successful, False otherwise
         """
-        input_path = Path(input_file)
+        # Plain string paths: this runs once per file in batches
+        input_file = os.fspath(input_file)
+        input_name = os.path.basename(input_file)
+        input_stem, input_suffix = os.path.splitext(input_name)
 
-        if not input_path.exists():
+        if not os.path.exists(input_file):
             if verbose:
                 print(f"ERROR: File not found: {input_file}")
             return False
 
-        if input_path.suffix.lower() not in ['.pptx', '.ppt']:
+        if input_suffix.lower() not in _PPTX_SUFFIXES:
             if verbose:
                 print(f"WARNING: {input_file} is not a PowerPoint file, skipping...")
             return False
 
         # Set output directory
         if output_dir:
-            out_dir = Path(output_dir)
-            out_dir.mkdir(parents=True, exist_ok=True)
+            os.makedirs(output_dir, exist_ok=True)
+            out_dir = output_dir
         else:
-            out_dir = input_path.parent
+            out_dir = os.path.dirname(input_file)
 
-        output_path = out_dir / f"{input_path.stem}.pdf"
+        # Use absolute paths for COM
+        abs_input = os.path.abspath(input_file)
+        abs_output = os.path.abspath(os.path.join(out_dir, input_stem + '.pdf'))
 
         if verbose:
-            file_size = input_path.stat().st_size / (1024 * 1024)  # MB
-            print(f"Converting: {input_path.name} ({file_size:.2f} MB)")
+            file_size = os.stat(input_file).st_size / (1024 * 1024)  # MB
+            print(f"Converting: {input_name} ({file_size:.2f} MB)")
             preset = self.QUALITY_SETTINGS[self.quality]
             print(f"Quality: {preset['name']} (PowerPoint COM)")
 
@@ -141,14 +169,10 @@ class PowerPointConverter:
             self._start_powerpoint()
 
             # Open presentation
-            # Use absolute path for COM
-            abs_input = str(input_path.absolute())
-            abs_output = str(output_path.absolute())
-
             if verbose:
                 print(f"Opening presentation in PowerPoint...")
 
-            presentation = self.powerpoint.Presentations.Open(
+            presentation = self._open(
                 abs_input,
                 ReadOnly=True,
                 Untitled=True,
@@ -176,26 +200,26 @@ class PowerPointConverter:
                 "",  # SlideShowName
                 True,  # IncludeDocProperties
                 True,  # KeepIRMSettings
-                True,  # DocStructureTags
-                True,  # BitmapMissingFonts
-                True   # UseISO19005_1 (PDF/A)
+                preset['tags'],  # DocStructureTags
+                preset['bitmap_missing'],  # BitmapMissingFonts
+                preset['pdfa']  # UseISO19005_1 (PDF/A)
             )
 
             # Check if PDF was created
-            if output_path.exists():
-                pdf_size = output_path.stat().st_size / (1024 * 1024)
-                if verbose:
-                    print(f"OK Success: {output_path.name} ({pdf_size:.2f} MB)")
-                return True
-            else:
+            try:
+                pdf_size = os.stat(abs_output).st_size / (1024 * 1024)
+            except FileNotFoundError:
                 if verbose:
-                    print(f"X Failed: PDF not created for {input_path.name}")
+                    print(f"X Failed: PDF not created for {input_name}")
                 return False
+            if verbose:
+                print(f"OK Success: {input_stem}.pdf ({pdf_size:.2f} MB)")
+            return True
 
         except Exception as e:
             import traceback
             if verbose:
-                print(f"X Error converting {input_path.name}:")
+                print(f"X Error converting {input_name}:")
                 print(f"  Error type: {type(e).__name__}")
                 print(f"  Error message: {str(e)}")
                 print(f"  Full traceback:")
@@ -210,6 +234,40 @@ class PowerPointConverter:
                 except:
                     pass
 
+    def convert_many(self, input_files, output_dir: str = None, verbose: bool = True, callback=None):
+        """
+        Convert several files with a single PowerPoint instance
+
+        PowerPoint is started once, reused for every file and quit at the end.
+        A file that fails doesn't stop the rest of the batch.
+
+        Args:
+            input_files: Paths to PPTX files
+            output_dir: Output directory (defaults to same as input)
+            verbose: Print conversion status
+            callback: Optional function called as callback(input_file, success, error)
+                after each file
+
+        Returns:
+            List of (input_file, success, error message or None) tuples
+        """
+        # COM must be initialized on every thread that uses it (e.g. a GUI worker thread)
+        pythoncom.CoInitialize()
+        results = []
+        try:
+            for input_file in input_files:
+                try:
+                    result = (input_file, self.convert_file(input_file, output_dir, verbose), None)
+                except Exception as e:
+                    result = (input_file, False, str(e))
+                results.append(result)
+                if callback:
+                    callback(*result)
+        finally:
+            self._quit_powerpoint()
+            pythoncom.CoUninitialize()
+        return results
+
     def __del__(self):
         """Cleanup: Quit PowerPoint when object is destroyed"""
         self._quit_powerpoint()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the soffice chunk retry in PPTXtoPDFConverter._convert_chunk
+Uses a stand-in soffice script, so LibreOffice doesn't need to be installed
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convert_pptx_to_pdf import PPTXtoPDFConverter
+
+# Converts its inputs in order and exits like a crash at any file named
+# *crash*, leaving the rest unconverted; hangs at *hang*, and takes a while
+# over *slow*; every run is logged as one line
+FAKE_SOFFICE = textwrap.dedent('''\
+    #!{python}
+    import os, sys, time
+    args = sys.argv[1:]
+    outdir = args[args.index('--outdir') + 1]
+    files = [a for a in args if not a.startswith('-') and a not in (outdir, 'pdf')]
+    with open({log!r}, 'a') as log:
+        log.write(' '.join(os.path.basename(f) for f in files) + '\\n')
+    for f in files:
+        name = os.path.basename(f)
+        if 'crash' in name:
+            sys.exit(1)
+        if 'hang' in name:
+            time.sleep(3600)
+        if 'slow' in name:
+            time.sleep(0.6)
+        with open(os.path.join(outdir, os.path.splitext(name)[0] + '.pdf'), 'wb') as pdf:
+            pdf.write(b'%PDF-1.4')
+''')
+
+
+@unittest.skipIf(os.name != 'posix', "the stand-in soffice is a script with a shebang line")
+class ConvertChunkRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        root = Path(self.temp.name)
+        self.log = root / 'soffice.log'
+        soffice = root / 'soffice'
+        soffice.write_text(FAKE_SOFFICE.format(python=sys.executable, log=str(self.log)))
+        soffice.chmod(0o755)
+
+        self.out_dir = root / 'out'
+        self.out_dir.mkdir()
+        self.converter = PPTXtoPDFConverter(str(soffice), use_powerpoint=False)
+        self.converter.work_dir = str(root / 'work')
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def runs(self):
+        return [line.split() for line in self.log.read_text().splitlines()]
+
+    def test_unconverted_files_are_retried_in_halves(self):
+        names = ['a', 'b', 'c', 'd', 'crash', 'e', 'f', 'g', 'h']
+        chunk = [Path(self.temp.name) / f"{name}.pptx" for name in names]
+
+        results = self.converter._convert_chunk(chunk, str(self.out_dir), verbose=False, profile_key='test')
+
+        self.assertEqual({path.stem for path, ok in results.items() if not ok}, {'crash'})
+        # The 5 files left over are retried as two halves, each in one run;
+        # only the half holding the bad deck is split further
+        self.assertEqual(self.runs(), [
+            [f"{name}.pptx" for name in names],
+            ['crash.pptx', 'e.pptx'],
+            ['crash.pptx'],
+            ['e.pptx'],
+            ['f.pptx', 'g.pptx', 'h.pptx'],
+        ])
+
+    def test_timed_out_files_are_retried_one_per_run(self):
+        self.converter.SOFFICE_TIMEOUT = 1
+        names = ['a', 'hang', 'b', 'c']
+        chunk = [Path(self.temp.name) / f"{name}.pptx" for name in names]
+
+        results = self.converter._convert_chunk(chunk, str(self.out_dir), verbose=False, profile_key='test')
+
+        self.assertEqual({path.stem for path, ok in results.items() if not ok}, {'hang'})
+        self.assertEqual(self.runs(), [
+            [f"{name}.pptx" for name in names],
+            ['hang.pptx'],
+            ['b.pptx'],
+            ['c.pptx'],
+        ])
+
+    def test_timeout_restarts_with_each_new_pdf(self):
+        self.converter.SOFFICE_TIMEOUT = 1
+        names = ['slow1', 'slow2', 'slow3', 'slow4']
+        chunk = [Path(self.temp.name) / f"{name}.pptx" for name in names]
+
+        results = self.converter._convert_chunk(chunk, str(self.out_dir), verbose=False, profile_key='test')
+
+        # 2.4 s in total, but never a second without a new PDF
+        self.assertTrue(all(results.values()))
+        self.assertEqual(len(self.runs()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()